@@ -0,0 +1,126 @@
+import { readFile, writeFile } from 'node:fs/promises';
+import path from 'node:path';
+import { routes, getRouteOutput } from '../routes.js';
+import { filterRules, selectorParts } from './css.js';
+
+const STYLESHEET_LINK = /<link rel="stylesheet"([^>]*?) href="([^"]+\.css)"[^>]*>/g;
+
+// Inutiles au premier affichage
+const NON_CRITICAL_AT_RULE = /^@(-webkit-)?keyframes\b|^@media print$/;
+
+// Pour chaque page pré-rendue, inline dans <head> les règles nécessaires au
+// premier écran (en-tête, fil d'Ariane, titre et introduction de la page)
+// et charge la feuille complète sans bloquer le rendu.
+//
+// Doit s'exécuter après le pré-rendu et avant la génération du service worker.
+export default function criticalCss() {
+  let outDir;
+  let base;
+
+  return {
+    name: 'tester-a11y:critical-css',
+    apply: 'build',
+    configResolved(config) {
+      outDir = path.resolve(config.root, config.build.outDir);
+      base = config.base;
+    },
+    closeBundle: {
+      sequential: true,
+      order: 'post',
+      async handler() {
+        const stylesheets = new Map();
+        const readStylesheet = (href) => {
+          if (!stylesheets.has(href)) {
+            stylesheets.set(
+              href,
+              readFile(path.join(outDir, href.slice(base.length)), 'utf-8')
+            );
+          }
+          return stylesheets.get(href);
+        };
+
+        const outputs = [
+          ...Object.keys(routes).map(getRouteOutput),
+          '404.html',
+        ];
+
+        await Promise.all(
+          outputs.map(async (output) => {
+            const file = path.join(outDir, output);
+            const html = await readFile(file, 'utf-8');
+
+            const links = [...html.matchAll(STYLESHEET_LINK)].filter(([, , href]) =>
+              href.startsWith(`${base}assets/`)
+            );
+            if (!links.length) {
+              return;
+            }
+
+            const fold = getAboveTheFold(html);
+            const critical = (
+              await Promise.all(links.map(([, , href]) => readStylesheet(href)))
+            )
+              .map((css) => extractCritical(css, fold, `${base}assets/`))
+              .join('');
+
+            // Le <style> prend la place de la première feuille : les feuilles
+            // complètes, chargées ensuite, restent prioritaires dans la cascade
+            let result = html;
+            links.forEach(([link, attributes, href], index) => {
+              result = result.replace(
+                link,
+                () =>
+                  (index === 0 ? `<style>${critical}</style>` : '') +
+                  `<link rel="preload"${attributes} href="${href}" as="style" onload="this.onload=null;this.rel='stylesheet'" />` +
+                  `<noscript><link rel="stylesheet"${attributes} href="${href}" /></noscript>`
+              );
+            });
+
+            await writeFile(file, result);
+          })
+        );
+      },
+    },
+  };
+}
+
+// Classes, identifiants et éléments présents dans le premier écran :
+// tout ce qui précède le premier <h2> de la page
+function getAboveTheFold(html) {
+  const body = html.slice(html.indexOf('<body'));
+  const outlet = body.indexOf('<router-outlet');
+  const heading = body.indexOf('<h2', outlet);
+  const close = body.indexOf('</router-outlet>', outlet);
+  const end = heading !== -1 && heading < close ? heading : close;
+  const markup = outlet === -1 ? body : body.slice(0, end);
+
+  const classes = new Set(
+    [...markup.matchAll(/\sclass="([^"]*)"/g)].flatMap(([, value]) =>
+      value.split(/\s+/)
+    )
+  );
+  const ids = new Set([...markup.matchAll(/\sid="([^"]*)"/g)].map(([, id]) => id));
+  const tags = new Set([
+    'html',
+    'body',
+    ...[...markup.matchAll(/<([a-zA-Z][\w-]*)/g)].map(([, tag]) => tag.toLowerCase()),
+  ]);
+
+  return { classes, ids, tags };
+}
+
+function extractCritical(css, fold, assetsPath) {
+  return filterRules(css, {
+    keepSelector: (selector) => {
+      const { classes, ids, tags } = selectorParts(selector);
+      return (
+        classes.every((name) => fold.classes.has(name)) &&
+        ids.every((id) => fold.ids.has(id)) &&
+        tags.every((tag) => fold.tags.has(tag))
+      );
+    },
+    keepAtRule: (prelude) => !NON_CRITICAL_AT_RULE.test(prelude),
+  })
+    // Les URL relatives de la feuille pointent vers assets/
+    .replace(/url\((["']?)(?!data:|https?:|\/)/g, `url($1${assetsPath}`);
+}
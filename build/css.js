@@ -0,0 +1,141 @@
+// Découpage minimal de feuilles CSS, suffisant pour les étapes de build
+// (tri des règles Font Awesome, purge du DSFR, CSS critique) sans
+// dépendance externe.
+
+// Découpe une feuille en règles de premier niveau : { prelude, body }.
+// `body` vaut null pour les at-rules sans bloc (@charset, @import).
+export function splitRules(css) {
+  const rules = [];
+  let start = 0;
+  let bodyStart = -1;
+  let depth = 0;
+  let quote = null;
+
+  for (let i = 0; i < css.length; i++) {
+    const char = css[i];
+
+    if (quote) {
+      if (char === '\\') {
+        i++;
+      } else if (char === quote) {
+        quote = null;
+      }
+    } else if (char === '"' || char === "'") {
+      quote = char;
+    } else if (char === '/' && css[i + 1] === '*') {
+      const end = css.indexOf('*/', i + 2);
+      i = end === -1 ? css.length : end + 1;
+    } else if (char === '{') {
+      if (depth++ === 0) {
+        bodyStart = i;
+      }
+    } else if (char === '}') {
+      if (--depth === 0) {
+        rules.push({
+          prelude: stripComments(css.slice(start, bodyStart)),
+          body: css.slice(bodyStart + 1, i),
+        });
+        start = i + 1;
+      }
+    } else if (char === ';' && depth === 0) {
+      rules.push({ prelude: stripComments(css.slice(start, i)), body: null });
+      start = i + 1;
+    }
+  }
+
+  return rules;
+}
+
+export function joinRules(rules) {
+  return rules
+    .map(({ prelude, body }) =>
+      body === null ? `${prelude};` : `${prelude}{${body}}`
+    )
+    .join('');
+}
+
+// Découpe une liste de sélecteurs sur les virgules de premier niveau
+// (les virgules de :is(), :not()... sont conservées)
+export function splitSelectors(prelude) {
+  const selectors = [];
+  let start = 0;
+  let depth = 0;
+
+  for (let i = 0; i < prelude.length; i++) {
+    const char = prelude[i];
+    if (char === '(' || char === '[') {
+      depth++;
+    } else if (char === ')' || char === ']') {
+      depth--;
+    } else if (char === ',' && depth === 0) {
+      selectors.push(prelude.slice(start, i).trim());
+      start = i + 1;
+    }
+  }
+
+  selectors.push(prelude.slice(start).trim());
+  return selectors;
+}
+
+export function stripComments(css) {
+  return css.replace(/\/\*[\s\S]*?\*\//g, '').trim();
+}
+
+// At-rules dont le bloc contient lui-même des règles
+const GROUPING_AT_RULE = /^@(media|supports|layer|container)\b/;
+
+// Filtre les règles d'une feuille, y compris celles des @media, @supports...
+// Une règle n'est gardée que si au moins un de ses sélecteurs l'est ;
+// `keepAtRule` décide des autres at-rules (@font-face, @keyframes...).
+export function filterRules(css, { keepSelector, keepAtRule = () => true }) {
+  const rules = splitRules(css).flatMap(({ prelude, body }) => {
+    if (prelude.startsWith('@')) {
+      if (!keepAtRule(prelude)) {
+        return [];
+      }
+      if (body === null || !GROUPING_AT_RULE.test(prelude)) {
+        return [{ prelude, body }];
+      }
+
+      const content = filterRules(body, { keepSelector, keepAtRule });
+      return content ? [{ prelude, body: content }] : [];
+    }
+
+    const selectors = splitSelectors(prelude).filter(keepSelector);
+    return selectors.length ? [{ prelude: selectors.join(','), body }] : [];
+  });
+
+  return joinRules(rules);
+}
+
+// Classes, identifiants et éléments imposés par un sélecteur. Les arguments
+// des pseudo-classes (:not(), :is()...) et les attributs sont ignorés :
+// le sélecteur est alors considéré comme moins restrictif qu'il ne l'est.
+export function selectorParts(selector) {
+  let simplified = '';
+  let depth = 0;
+  for (const char of selector) {
+    if (char === '(' || char === '[') {
+      depth++;
+    } else if (char === ')' || char === ']') {
+      depth--;
+    } else if (depth === 0) {
+      simplified += char;
+    }
+  }
+  simplified = simplified.replace(/::?[\w-]+/g, '');
+
+  const names = (prefix) =>
+    [...simplified.matchAll(new RegExp(`\\${prefix}(-?[_a-zA-Z][\\w-]*)`, 'g'))].map(
+      (match) => match[1]
+    );
+
+  return {
+    classes: names('.'),
+    ids: names('#'),
+    tags: simplified
+      .split(/[\s>+~]+/)
+      .map((compound) => compound.match(/^[a-zA-Z][\w-]*/)?.[0].toLowerCase())
+      .filter(Boolean),
+  };
+}
@@ -0,0 +1,73 @@
+import path from 'node:path';
+import { filterRules, selectorParts } from './css.js';
+import { readSources } from './sources.js';
+
+const CDN_STYLESHEET =
+  /https:\/\/cdn\.jsdelivr\.net\/npm\/@gouvfr\/dsfr@[\d.]+\/dist\/([\w/.-]+\.css)/g;
+
+const PACKAGE_DIR = 'node_modules/@gouvfr/dsfr';
+
+// Classes d'état ajoutées par le JavaScript du DSFR (menus, modales, onglets...) :
+// absentes des sources, elles doivent être conservées
+const SAFELIST = [
+  /--(expanded|opened|selected|active|direction-(start|end))$/,
+  /^fr-(collapsing|no-scroll|js)/,
+];
+
+// Héberge les feuilles du DSFR avec le site au lieu de les charger depuis jsDelivr :
+// - au build, les liens jsDelivr de index.html pointent vers le paquet
+//   @gouvfr/dsfr installé (devDependency, même version que le CDN) ;
+// - les sélecteurs dont les classes ou identifiants n'apparaissent dans aucune
+//   source sont retirés, puis Vite regroupe le résultat avec les autres styles
+//   et émet les polices et icônes encore référencées.
+export default function dsfr({ sources }) {
+  let root;
+  let packageDir;
+  let used;
+
+  const scan = () => (used ??= scanTokens(root, sources));
+
+  return {
+    name: 'tester-a11y:dsfr',
+    apply: 'build',
+    enforce: 'pre',
+    configResolved(config) {
+      root = config.root;
+      packageDir = path.join(config.root, PACKAGE_DIR);
+    },
+    transformIndexHtml: {
+      order: 'pre',
+      handler(html) {
+        return html.replace(CDN_STYLESHEET, (url, file) => `${PACKAGE_DIR}/dist/${file}`);
+      },
+    },
+    async transform(code, id) {
+      const file = path.relative(packageDir, id.split('?')[0]);
+      if (!/^dist[\\/].+\.css$/.test(file)) {
+        return null;
+      }
+
+      const tokens = await scan();
+      const isUsed = (name) =>
+        tokens.has(name) || SAFELIST.some((pattern) => pattern.test(name));
+
+      const css = filterRules(code, {
+        keepSelector: (selector) => {
+          const { classes, ids } = selectorParts(selector);
+          return classes.every(isUsed) && ids.every(isUsed);
+        },
+      })
+        // Le WOFF2 suffit aux navigateurs ciblés : les WOFF ne sont pas émis
+        .replace(/,url\([^)]*\.woff\) format\(["']woff["']\)/g, '');
+
+      return { code: css, map: null };
+    },
+  };
+}
+
+// Tous les mots des sources : classes et identifiants, y compris ceux
+// construits ou basculés depuis le JavaScript
+async function scanTokens(root, sources) {
+  const contents = await readSources(root, sources);
+  return new Set(contents.join(' ').match(/[\w-]+/g));
+}
@@ -0,0 +1,194 @@
+import { createHash } from 'node:crypto';
+import { readFile, readdir, unlink, writeFile } from 'node:fs/promises';
+import path from 'node:path';
+import subsetFont from 'subset-font';
+import { joinRules, splitRules, splitSelectors } from './css.js';
+import { readSources } from './sources.js';
+
+// Latin de base et Latin-1 (accents français, « », espaces insécables),
+// complétés par la ponctuation typographique courante
+const BASE_CHARACTERS =
+  range(0x20, 0x7e) + range(0xa0, 0xff) + 'ŒœŸ‘’‚“”„…–—•€\u2009\u202f';
+
+const FONT_AWESOME_STYLES = {
+  solid: ['fa-solid', 'fas'],
+  regular: ['fa-regular', 'far'],
+  brands: ['fa-brands', 'fab'],
+};
+
+// Faces Luciole préchargées : texte courant et titres
+const PRELOADED_FONTS = ['Luciole-Regular', 'Luciole-Bold'];
+
+// Réduit les polices au strict nécessaire :
+// - Font Awesome ne garde que les icônes et les styles utilisés dans les pages ;
+// - Luciole et Font Awesome sont ré-échantillonnées (WOFF2) sur les glyphes utilisés
+//   avec `subset-font` (devDependency) ;
+// - les faces Luciole critiques sont préchargées dans index.html.
+export default function fonts({ sources }) {
+  let root;
+  let outDir;
+  let base;
+  let usage;
+  let iconCharacters = '';
+
+  const scan = () => (usage ??= scanSources(root, sources));
+
+  return {
+    name: 'tester-a11y:fonts',
+    apply: 'build',
+    enforce: 'pre',
+    configResolved(config) {
+      root = config.root;
+      outDir = path.resolve(config.root, config.build.outDir);
+      base = config.base;
+    },
+    async transform(code, id) {
+      if (!id.split('?')[0].endsWith('fontawesome/all.min.css')) {
+        return null;
+      }
+
+      const { classes } = await scan();
+      const { css, characters } = trimFontAwesome(code, classes);
+      iconCharacters = characters;
+
+      return { code: css, map: null };
+    },
+    closeBundle: {
+      sequential: true,
+      order: 'post',
+      async handler() {
+        const assetsDir = path.join(outDir, 'assets');
+        const assets = await readdir(assetsDir);
+
+        const { text } = await scan();
+        const renames = new Map();
+
+        await Promise.all(
+          assets
+            .filter((file) => file.endsWith('.woff2'))
+            .map(async (file) => {
+              const characters = file.startsWith('Luciole-')
+                ? BASE_CHARACTERS + text
+                : file.startsWith('fa-')
+                  ? iconCharacters
+                  : null;
+              if (!characters) {
+                return;
+              }
+
+              const font = await readFile(path.join(assetsDir, file));
+              const subset = await subsetFont(font, characters, {
+                targetFormat: 'woff2',
+              });
+
+              // Nouveau nom haché : le contenu change avec les glyphes utilisés
+              const name = file.replace(/-[\w-]{8}\.woff2$/, '');
+              const renamed = `${name}-${hash(subset)}.woff2`;
+
+              await writeFile(path.join(assetsDir, renamed), subset);
+              await unlink(path.join(assetsDir, file));
+              renames.set(file, renamed);
+            })
+        );
+
+        await Promise.all(
+          assets
+            .filter((file) => file.endsWith('.css'))
+            .map(async (file) => {
+              let css = await readFile(path.join(assetsDir, file), 'utf-8');
+              renames.forEach((renamed, original) => {
+                css = css.replaceAll(original, renamed);
+              });
+              await writeFile(path.join(assetsDir, file), css);
+            })
+        );
+
+        const fontFiles = (await readdir(assetsDir)).filter((file) =>
+          file.endsWith('.woff2')
+        );
+        const preloads = PRELOADED_FONTS.map((name) =>
+          fontFiles.find((file) => file.startsWith(`${name}-`))
+        )
+          .filter(Boolean)
+          .map(
+            (file) =>
+              `<link rel="preload" href="${base}assets/${file}" as="font" type="font/woff2" crossorigin />`
+          );
+
+        const indexFile = path.join(outDir, 'index.html');
+        const html = await readFile(indexFile, 'utf-8');
+        await writeFile(
+          indexFile,
+          html.replace('</head>', () => `  ${preloads.join('\n    ')}\n  </head>`)
+        );
+      },
+    },
+  };
+}
+
+// Texte et classes Font Awesome utilisés par les pages, les composants et le JS
+async function scanSources(root, sources) {
+  const contents = await readSources(root, sources);
+  const text = [...new Set(contents.join(''))].join('');
+  const classes = new Set(contents.join(' ').match(/\bfa(?:-[a-z0-9-]+|[srb])?\b/g));
+
+  return { text, classes };
+}
+
+// Conserve les règles génériques de Font Awesome, mais seulement les icônes
+// utilisées et les @font-face (WOFF2) des styles utilisés
+function trimFontAwesome(code, classes) {
+  const license = code.match(/^\/\*![\s\S]*?\*\//)?.[0] ?? '';
+  const styles = Object.keys(FONT_AWESOME_STYLES).filter((style) =>
+    FONT_AWESOME_STYLES[style].some((className) => classes.has(className))
+  );
+
+  let characters = '';
+  const rules = splitRules(code).flatMap(({ prelude, body }) => {
+    if (prelude === '@font-face') {
+      const style = body.match(/webfonts\/fa-([a-z0-9]+)-/)?.[1];
+      // Les familles Font Awesome 5 et FontAwesome (v4) ne servent qu'aux anciens noms
+      if (!body.includes('Font Awesome 6') || !styles.includes(style)) {
+        return [];
+      }
+
+      return [{ prelude, body: body.replace(/,url\([^)]*\.ttf\) format\('truetype'\)/, '') }];
+    }
+
+    const selectors = splitSelectors(prelude);
+    const isIcon =
+      body?.startsWith('content:') &&
+      selectors.every((selector) => /^\.fa-[\w-]+::?before$/.test(selector));
+    if (!isIcon) {
+      return [{ prelude, body }];
+    }
+
+    const used = selectors.filter((selector) =>
+      classes.has(selector.match(/^\.(fa-[\w-]+)/)[1])
+    );
+    if (!used.length) {
+      return [];
+    }
+
+    const codepoint = body.match(/content:["']\\([0-9a-f]+)["']/)?.[1];
+    if (codepoint) {
+      characters += String.fromCodePoint(parseInt(codepoint, 16));
+    }
+
+    return [{ prelude: used.join(','), body }];
+  });
+
+  return { css: license + joinRules(rules), characters };
+}
+
+function range(start, end) {
+  let characters = '';
+  for (let codepoint = start; codepoint <= end; codepoint++) {
+    characters += String.fromCodePoint(codepoint);
+  }
+  return characters;
+}
+
+function hash(content) {
+  return createHash('sha256').update(content).digest('base64url').slice(0, 8);
+}
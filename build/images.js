@@ -0,0 +1,201 @@
+import { mkdir, readFile, readdir, writeFile } from 'node:fs/promises';
+import path from 'node:path';
+import sharp from 'sharp';
+
+const WIDTHS = [320, 640, 960, 1280, 1920];
+const FORMATS = [
+  { format: 'avif', type: 'image/avif' },
+  { format: 'webp', type: 'image/webp' },
+];
+const RASTER_EXTENSIONS = ['.jpg', '.jpeg', '.png'];
+
+// Génère les variantes AVIF/WebP des images et un manifeste (dimensions,
+// variantes, placeholder flouté). Dans les pages copiées dans /dist, chaque
+// <custom-picture> reçoit son entrée (attribut data-image) et les balises
+// <img> sont réécrites en <picture> : une page ne porte que ses propres images.
+export default function images({ src }) {
+  let root;
+  let outDir;
+
+  return {
+    name: 'tester-a11y:images',
+    apply: 'build',
+    configResolved(config) {
+      root = config.root;
+      outDir = path.resolve(config.root, config.build.outDir);
+    },
+    closeBundle: {
+      sequential: true,
+      order: 'post',
+      async handler() {
+        const manifest = {};
+        const files = await readdir(path.join(root, src));
+
+        await mkdir(path.join(outDir, src), { recursive: true });
+
+        await Promise.all(
+          files.map(async (file) => {
+            const input = await readFile(path.join(root, src, file));
+            const size = readImageSize(input, path.extname(file).toLowerCase());
+            if (!size) {
+              return;
+            }
+
+            const image = { ...size, sources: [] };
+            if (RASTER_EXTENSIONS.includes(path.extname(file).toLowerCase())) {
+              Object.assign(image, await createVariants(input, file, size));
+            }
+
+            manifest[`${src}/${file}`] = image;
+          })
+        );
+
+        for (const directory of ['pages', 'components']) {
+          await rewriteImages(path.join(outDir, directory), manifest);
+        }
+      },
+    },
+  };
+
+  async function createVariants(input, file, { width }) {
+    const name = path.basename(file, path.extname(file));
+    const widths = [...WIDTHS.filter((value) => value < width), Math.min(width, 1920)];
+    const uniqueWidths = [...new Set(widths)];
+
+    const sources = await Promise.all(
+      FORMATS.map(async ({ format, type }) => {
+        const candidates = await Promise.all(
+          uniqueWidths.map(async (variantWidth) => {
+            const variant = `${name}-${variantWidth}.${format}`;
+            await sharp(input)
+              .rotate()
+              .resize({ width: variantWidth })
+              .toFormat(format)
+              .toFile(path.join(outDir, src, variant));
+
+            return `${src}/${variant} ${variantWidth}w`;
+          })
+        );
+
+        return { type, srcset: candidates.join(', ') };
+      })
+    );
+
+    const placeholder = await sharp(input)
+      .rotate()
+      .resize({ width: 16 })
+      .blur()
+      .webp()
+      .toBuffer();
+
+    return {
+      sources,
+      placeholder: `data:image/webp;base64,${placeholder.toString('base64')}`,
+    };
+  }
+}
+
+async function rewriteImages(directory, manifest) {
+  const entries = await readdir(directory, { recursive: true });
+
+  await Promise.all(
+    entries
+      .filter((entry) => entry.endsWith('.html'))
+      .map(async (entry) => {
+        const file = path.join(directory, entry);
+        const html = await readFile(file, 'utf-8');
+        const rewritten = html
+          .replace(/<img\b([^>]*?)\s*\/?>/g, (tag, attributes) =>
+            renderPicture(attributes, manifest)
+          )
+          .replace(/<custom-picture\b([^>]*?)(\s*\/?)>/g, (tag, attributes, end) =>
+            describePicture(tag, attributes, end, manifest)
+          );
+
+        if (rewritten !== html) {
+          await writeFile(file, rewritten);
+        }
+      })
+  );
+}
+
+function renderPicture(attributes, manifest) {
+  const src = attributes.match(/\bsrc="([^"]*)"/)?.[1];
+  const image = manifest[src];
+
+  let img = attributes;
+  if (!/\bloading=/.test(img)) {
+    img += ' loading="lazy"';
+  }
+  if (!/\bdecoding=/.test(img)) {
+    img += ' decoding="async"';
+  }
+  if (image && !/\b(width|height)=/.test(img)) {
+    img += ` width="${image.width}" height="${image.height}"`;
+  }
+
+  if (!image?.sources.length) {
+    return `<img${img} />`;
+  }
+
+  const sizes = attributes.match(/\bsizes="([^"]*)"/)?.[1] ?? '100vw';
+  const sources = image.sources
+    .map(
+      ({ type, srcset }) =>
+        `<source type="${type}" srcset="${srcset}" sizes="${sizes}" />`
+    )
+    .join('');
+
+  return `<picture>${sources}<img${img} /></picture>`;
+}
+
+// L'entrée du manifeste est lue par <custom-picture> au montage
+function describePicture(tag, attributes, end, manifest) {
+  const src = attributes.match(/\bsrc="([^"]*)"/)?.[1];
+  const image = manifest[src];
+  if (!image || /\bdata-image=/.test(attributes)) {
+    return tag;
+  }
+
+  const json = JSON.stringify(image).replaceAll('&', '&amp;').replaceAll('"', '&quot;');
+  return `<custom-picture${attributes} data-image="${json}"${end}>`;
+}
+
+// Lit les dimensions intrinsèques sans dépendance (en-têtes PNG/JPEG, attributs SVG)
+function readImageSize(buffer, extension) {
+  if (extension === '.png') {
+    return { width: buffer.readUInt32BE(16), height: buffer.readUInt32BE(20) };
+  }
+
+  if (extension === '.jpg' || extension === '.jpeg') {
+    let offset = 2;
+    while (offset < buffer.length) {
+      const marker = buffer[offset + 1];
+      // Marqueurs SOFn (hors DHT, JPG et DAC) : ils portent les dimensions
+      if (marker >= 0xc0 && marker <= 0xcf && ![0xc4, 0xc8, 0xcc].includes(marker)) {
+        return {
+          width: buffer.readUInt16BE(offset + 7),
+          height: buffer.readUInt16BE(offset + 5),
+        };
+      }
+      offset += 2 + buffer.readUInt16BE(offset + 2);
+    }
+    return null;
+  }
+
+  if (extension === '.svg') {
+    const svg = buffer.toString('utf-8').match(/<svg\b[^>]*>/)?.[0] ?? '';
+    const width = svg.match(/\bwidth="([\d.]+)"/)?.[1];
+    const height = svg.match(/\bheight="([\d.]+)"/)?.[1];
+    if (width && height) {
+      return { width: Math.round(width), height: Math.round(height) };
+    }
+
+    const viewBox = svg.match(/\bviewBox="[\d.-]+ [\d.-]+ ([\d.]+) ([\d.]+)"/);
+    if (viewBox) {
+      return { width: Math.round(viewBox[1]), height: Math.round(viewBox[2]) };
+    }
+  }
+
+  return null;
+}
@@ -0,0 +1,76 @@
+import { readFile, writeFile } from 'node:fs/promises';
+import path from 'node:path';
+import {
+  routes,
+  notFoundRoute,
+  titlePage,
+  getRouteOutput,
+} from '../routes.js';
+
+// Génère au build un fichier HTML complet par route : le routeur client
+// hydrate ce HTML au lieu d'enchaîner main.html -> composants -> page.
+export default function prerender() {
+  let outDir;
+
+  return {
+    name: 'tester-a11y:prerender',
+    apply: 'build',
+    configResolved(config) {
+      outDir = path.resolve(config.root, config.build.outDir);
+    },
+    closeBundle: {
+      sequential: true,
+      order: 'post',
+      async handler() {
+        const read = (file) => readFile(path.join(outDir, file), 'utf-8');
+
+        const template = await read('index.html');
+        const [main, header, footer, alert] = await Promise.all([
+          read('components/main/main.html'),
+          read('components/header/header.html'),
+          read('components/footer/footer.html'),
+          read('components/alert/alert.html'),
+        ]);
+
+        // Les remplacements passent par des fonctions : le contenu des pages
+        // peut contenir des motifs spéciaux de String.replace (`$&`, `$1`...)
+        const shell = main
+          .replace('<custom-header></custom-header>', () => fill('custom-header', header))
+          .replace('<custom-footer></custom-footer>', () => fill('custom-footer', footer))
+          .replace('<custom-alert></custom-alert>', () => fill('custom-alert', alert));
+
+        const pages = [
+          ...Object.entries(routes).map(([route, page]) => ({
+            ...page,
+            output: getRouteOutput(route),
+          })),
+          // GitHub Pages sert 404.html pour toute URL inconnue
+          { ...notFoundRoute, output: '404.html' },
+        ];
+
+        await Promise.all(
+          pages.map(async ({ filename, title, lang = 'fr', output }) => {
+            const page = await read(filename);
+            const content = shell.replace('<router-outlet></router-outlet>', () =>
+              fill('router-outlet', page, filename)
+            );
+
+            const html = template
+              .replace(/<html lang="[^"]*">/, `<html lang="${lang}">`)
+              .replace(/<title>.*<\/title>/, `<title>${title} - ${titlePage}</title>`)
+              .replace(
+                '<div id="app"></div>',
+                () => `<div id="app" data-prerendered>${content}</div>`
+              );
+
+            await writeFile(path.join(outDir, output), html);
+          })
+        );
+      },
+    },
+  };
+}
+
+function fill(tagName, innerHTML, marker = '') {
+  return `<${tagName} data-prerendered="${marker}">${innerHTML}</${tagName}>`;
+}
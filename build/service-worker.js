@@ -0,0 +1,90 @@
+import { createHash } from 'node:crypto';
+import { readFile, readdir, writeFile } from 'node:fs/promises';
+import path from 'node:path';
+import { fileURLToPath } from 'node:url';
+
+// Extensions préchargées ; les images sont mises en cache à la première
+// consultation et les anciens formats de police (eot, svg, ttf) sont ignorés.
+const PRECACHE_EXTENSIONS = ['.html', '.js', '.css', '.woff2', '.json'];
+
+// Génère dist/sw.js à partir de sw.js, avec la liste des fichiers du build
+// et leur révision (empreinte du contenu).
+export default function serviceWorker({ targets }) {
+  let outDir;
+  let base;
+
+  return {
+    name: 'tester-a11y:service-worker',
+    apply: 'build',
+    configResolved(config) {
+      outDir = path.resolve(config.root, config.build.outDir);
+      base = config.base;
+    },
+    closeBundle: {
+      sequential: true,
+      order: 'post',
+      async handler() {
+        // Dossiers copiés par viteStaticCopy, le bundle Vite et les pages pré-rendues
+        const directories = [
+          ...targets.map(({ src, dest }) => path.join(dest, path.basename(src))),
+          'assets',
+        ];
+
+        const files = [
+          ...(await listFiles(outDir, '')),
+          ...(
+            await Promise.all(
+              directories.map((directory) => listFiles(outDir, directory, true))
+            )
+          ).flat(),
+        ].filter((file) => PRECACHE_EXTENSIONS.includes(path.extname(file)));
+
+        const manifest = await Promise.all(
+          files.sort().map(async (file) => ({
+            url: `${base}${file.split(path.sep).join('/')}`,
+            revision: hash(await readFile(path.join(outDir, file))),
+          }))
+        );
+
+        const template = await readFile(
+          fileURLToPath(new URL('../sw.js', import.meta.url)),
+          'utf-8'
+        );
+
+        const source = template
+          .replace('self.__PRECACHE_MANIFEST__', () => JSON.stringify(manifest))
+          .replace('self.__PRECACHE_VERSION__', () =>
+            JSON.stringify(hash(JSON.stringify(manifest)))
+          );
+
+        await writeFile(path.join(outDir, 'sw.js'), source);
+      },
+    },
+  };
+}
+
+async function listFiles(root, directory, recursive = false) {
+  let entries;
+  try {
+    entries = await readdir(path.join(root, directory), { withFileTypes: true });
+  } catch {
+    return [];
+  }
+
+  const files = await Promise.all(
+    entries.map(async (entry) => {
+      const file = path.join(directory, entry.name);
+      if (entry.isDirectory()) {
+        return recursive ? await listFiles(root, file, true) : [];
+      }
+
+      return [file];
+    })
+  );
+
+  return files.flat();
+}
+
+function hash(content) {
+  return createHash('md5').update(content).digest('hex').slice(0, 10);
+}
@@ -0,0 +1,21 @@
+import { readFile, readdir } from 'node:fs/promises';
+import path from 'node:path';
+
+// Contenu des fichiers HTML et JS des sources (dossiers ou fichiers isolés),
+// analysé par les étapes de build pour savoir ce que les pages utilisent
+export async function readSources(root, sources) {
+  const files = (
+    await Promise.all(
+      sources.map(async (source) => {
+        const entries = await readdir(path.join(root, source), {
+          recursive: true,
+        }).catch(() => ['']);
+        return entries.map((entry) => path.join(root, source, entry));
+      })
+    )
+  )
+    .flat()
+    .filter((file) => ['.html', '.js'].includes(path.extname(file)));
+
+  return await Promise.all(files.map((file) => readFile(file, 'utf-8')));
+}
@@ -1,14 +1,18 @@
-const absolutePath = '/tester-a11y';
-const titlePage = `Démo accessibilité numérique`;
-
-window.onload = () => {
-  getHtmlContent('components/main/main.html').then((innerHTML) => {
-    document.querySelector('#app').innerHTML = innerHTML;
-    loadComponents();
+import { absolutePath, titlePage, routes, getRoute } from './routes.js';
+import { hideAlert } from './src/components/alert/alert.js';
+
+// Service worker : précharge le site pour un usage hors ligne (build uniquement)
+if (import.meta.env.PROD && 'serviceWorker' in navigator) {
+  window.addEventListener('load', () => {
+    navigator.serviceWorker.register(`${absolutePath}/sw.js`, {
+      scope: `${absolutePath}/`,
+    });
   });
-};
+}
 
 function loadComponents() {
+  initDelegatedEvents();
+
   customElements.define('router-outlet', RouterOutlet);
   customElements.define('router-link', RouterLink);
   customElements.define('custom-header', CustomHeader);
@@ -17,10 +21,73 @@ function loadComponents() {
   customElements.define('custom-alert', CustomAlert);
 }
 
+// Un seul écouteur pour toute l'application : les liens et l'alerte
+// sont remplacés à chaque navigation sans laisser d'écouteurs derrière eux
+function initDelegatedEvents() {
+  document.querySelector('#app').addEventListener('click', (event) => {
+    const link = event.target.closest('a[href]');
+    if (link && isInAppNavigation(event, link)) {
+      event.preventDefault();
+
+      // Sans rechargement, le menu mobile du DSFR resterait ouvert
+      const modal = link.closest('.fr-modal--opened');
+      if (modal) {
+        window.dsfr?.(modal).modal?.conceal();
+      }
+
+      const { pathname, hash } = new URL(link.href);
+      document.querySelector('router-outlet').navigate(pathname + hash);
+      return;
+    }
+
+    if (event.target.closest('.alert-button')) {
+      hideAlert();
+    }
+  });
+}
+
+// Les liens internes vers une route connue changent de page sans recharger
+// le document ; les clics modifiés, nouveaux onglets et ancres restent natifs
+function isInAppNavigation(event, link) {
+  if (
+    event.button !== 0 ||
+    event.ctrlKey ||
+    event.metaKey ||
+    event.shiftKey ||
+    event.altKey ||
+    (link.target && link.target !== '_self') ||
+    link.hasAttribute('download')
+  ) {
+    return false;
+  }
+
+  const url = new URL(link.href);
+  if (url.hash && url.pathname === window.location.pathname) {
+    return false;
+  }
+
+  return getInAppRoute(link.href) !== null;
+}
+
+// Route de l'application désignée par une URL, ou null pour tout autre lien
+function getInAppRoute(href) {
+  const url = new URL(href, window.location.href);
+  if (
+    url.origin !== window.location.origin ||
+    !url.pathname.startsWith(`${absolutePath}/`)
+  ) {
+    return null;
+  }
+
+  const path = url.pathname.slice(absolutePath.length);
+  return routes[path] ? path : null;
+}
+
 class CustomHeader extends HTMLElement {
   async connectedCallback() {
-    // loadStylesheet('components/header/header.scss');
-    this.innerHTML = await getHtmlContent('components/header/header.html');
+    if (!consumePrerendered(this)) {
+      this.innerHTML = await getHtmlContent('components/header/header.html');
+    }
 
     this.initTheme();
     setAriaCurrentPage();
@@ -71,8 +138,9 @@ class CustomHeader extends HTMLElement {
 
 class CustomFooter extends HTMLElement {
   async connectedCallback() {
-    // loadStylesheet('components/footer/footer.scss');
-    this.innerHTML = await getHtmlContent('components/footer/footer.html');
+    if (!consumePrerendered(this)) {
+      this.innerHTML = await getHtmlContent('components/footer/footer.html');
+    }
   }
 }
 
@@ -82,10 +150,20 @@ class CustomPicture extends HTMLElement {
   }
 
   connectedCallback() {
+    const src = this.attributes.src.value;
+    // Dimensions et variantes ajoutées au build (absentes en développement)
+    const image = this.dataset.image ? JSON.parse(this.dataset.image) : null;
+
     let img = document.createElement('img');
     img.alt = this.attributes.alt.value;
-    img.src = this.attributes.src.value;
-    img.setAttribute('lazy', 'loading');
+    img.src = src;
+    img.loading = 'lazy';
+    img.decoding = 'async';
+
+    if (image) {
+      img.width = image.width;
+      img.height = image.height;
+    }
 
     if (this.attributes.style) {
       img.style = this.attributes.style.value;
@@ -97,13 +175,46 @@ class CustomPicture extends HTMLElement {
       });
     }
 
-    this.appendChild(img);
+    // Aperçu flouté affiché le temps du chargement
+    if (image?.placeholder) {
+      img.style.backgroundImage = `url(${image.placeholder})`;
+      img.style.backgroundSize = 'cover';
+      img.addEventListener(
+        'load',
+        () => img.style.removeProperty('background-image'),
+        { once: true }
+      );
+    }
+
+    if (!image?.sources.length) {
+      this.appendChild(img);
+      return;
+    }
+
+    const picture = document.createElement('picture');
+    const sizes = this.attributes.sizes?.value ?? '100vw';
+
+    image.sources.forEach(({ type, srcset }) => {
+      const source = document.createElement('source');
+      source.type = type;
+      source.srcset = srcset;
+      source.sizes = sizes;
+      picture.appendChild(source);
+    });
+
+    picture.appendChild(img);
+    this.appendChild(picture);
   }
 }
 
 class RouterOutlet extends HTMLElement {
   constructor() {
     super();
+    this.navigationId = 0;
+    // Vrai dès qu'une page a été affichée (le repli par rechargement est alors sûr)
+    this.rendered = false;
+    this.currentModule = null;
+    this.controller = null;
     window.addEventListener('popstate', () => this.handleRoute());
   }
 
@@ -113,75 +224,69 @@ class RouterOutlet extends HTMLElement {
 
   async handleRoute() {
     const path = window.location.pathname.replace(absolutePath, '');
+    const route = getRoute(path);
+    const { filename, title, lang = 'fr' } = route;
+
+    // Une navigation plus récente rend le résultat de celle-ci obsolète
+    const navigationId = ++this.navigationId;
+    this.unmountRoute();
+
+    let innerHTML;
+    let module;
+    try {
+      [innerHTML, module] = await Promise.all([
+        consumePrerendered(this, filename) ? null : getHtmlContent(filename),
+        route.module?.(),
+      ]);
+    } catch (error) {
+      // Onglet ouvert avant un déploiement : ses modules et fragments ont pu
+      // disparaître. Un chargement complet récupère la nouvelle version.
+      if (navigationId !== this.navigationId) {
+        return false;
+      }
+      if (this.rendered) {
+        window.location.assign(window.location.href);
+        return false;
+      }
+      throw error;
+    }
 
-    let title = '';
-    let filename = '';
-    switch (path) {
-      case '/':
-        filename = 'pages/accueil.html';
-        title = 'Accueil';
-        break;
-      case '/les-contrastes':
-        filename = 'pages/les-contrastes.html';
-        title = 'Testons les contrastes';
-        break;
-      case '/la-langue':
-        filename = 'pages/cas-pratique-2.html';
-        title = 'Testons la langue';
-        break;
-      case '/les-images':
-        filename = 'pages/les-images.html';
-        title = 'Les images';
-        break;
-      case '/les-formulaires':
-        filename = 'pages/les-formulaires.html';
-        title = 'Les formulaires';
-        break;
-      case '/cas-pratique-5':
-        filename = 'pages/cas-pratique-5.html';
-        title = 'Cas pratique n°5 : les liens';
-        break;
-      case '/cas-pratique-6':
-        filename = 'pages/cas-pratique-6.html';
-        title = 'Cas pratique n°6 : les boutons';
-        break;
-      case '/ci-cd':
-        filename = 'pages/ci-cd.html';
-        title = 'Tests automatisés';
-        break;
-      case '/bonus':
-        filename = 'pages/bonus.html';
-        title = 'Bonus';
-        break;
-      case '/faq':
-        filename = 'pages/faq.html';
-        title = 'Foire aux questions';
-        break;
-      case '/ressources':
-        filename = 'pages/ressources.html';
-        title = 'Ressources';
-        break;
-      case '/a-propos':
-        filename = 'pages/a-propos.html';
-        title = 'A propos';
-        break;
-      default:
-        filename = 'pages/erreur.html';
-        title = 'Erreur 404';
-    }
-
-    this.innerHTML = await getHtmlContent(filename);
+    if (navigationId !== this.navigationId) {
+      return false;
+    }
+
+    if (innerHTML !== null) {
+      this.innerHTML = innerHTML;
+    }
     document.title = `${title} - ${titlePage}`;
 
     // Changer la langue de la page HTML selon la route
-    if (path === '/la-langue') {
-      document.documentElement.setAttribute('lang', 'en');
-    } else {
-      document.documentElement.setAttribute('lang', 'fr');
-    }
+    document.documentElement.setAttribute('lang', lang);
 
-    this.initJavascript(path);
+    this.mountRoute(module);
     this.setCurrentPage(document.title);
+    setAriaCurrentPage();
+    prefetchVisibleLinks();
+    this.rendered = true;
+    return true;
+  }
+
+  mountRoute(module) {
+    if (!module) {
+      return;
+    }
+
+    // Les écouteurs ajoutés avec ce signal sont retirés au changement de page
+    this.controller = new AbortController();
+    this.currentModule = module;
+    module.mount?.(this, { signal: this.controller.signal });
+  }
+
+  unmountRoute() {
+    this.controller?.abort();
+    this.currentModule?.unmount?.();
+    this.controller = null;
+    this.currentModule = null;
   }
 
   setCurrentPage(title) {
@@ -189,141 +294,227 @@ class RouterOutlet extends HTMLElement {
   }
 
   async navigate(path) {
+    const start = performance.now();
+
     window.history.pushState({}, '', path);
-    await this.handleRoute();
-  }
+    if (!(await this.handleRoute())) {
+      return;
+    }
 
-  initJavascript(path) {
-    if (path === '/les-images') {
-      document
-        .getElementById('show-button')
-        .addEventListener('click', (event) => {
-          displayPicture('.images');
-
-          const element = event.target;
-
-          const hasHidden = document.querySelector('.hidden') !== null;
-
-          if (hasHidden) {
-            element.innerText = 'Afficher les images';
-          } else {
-            element.innerText = 'Cacher les images';
-          }
-        });
-    }
-
-    if (path === '/les-formulaires') {
-      // FORMULAIRE INACCESSIBLE : Uniquement bordure rouge, aucun message, aucun ARIA
-      const btnBad = document.getElementById('btnSubmitBad');
-      if (btnBad) {
-        btnBad.addEventListener('click', () => {
-          const form = document.getElementById('form-bad');
-          const inputs = form.querySelectorAll('input');
-
-          for (const input of inputs) {
-            const hasValid = input.value.trim() !== '';
-
-            if (!hasValid) {
-              // Uniquement changement de bordure en rouge
-              input.style.borderColor = 'red';
-              input.style.borderWidth = '2px';
-            } else {
-              // Retirer la bordure rouge
-              input.style.borderColor = '';
-              input.style.borderWidth = '';
-            }
-          }
-          // Pas d'alerte, pas de message d'erreur, pas d'ARIA
-        });
+    // Comme lors d'un chargement de page : défilement vers l'ancre ou en haut
+    const anchor = window.location.hash
+      ? document.getElementById(decodeURIComponent(window.location.hash.slice(1)))
+      : null;
+    if (anchor) {
+      anchor.scrollIntoView();
+    } else {
+      window.scrollTo(0, 0);
+    }
+
+    // Le focus resterait sur le lien cliqué (ou derrière le menu refermé) :
+    // il est placé sur l'ancre ou sur le titre de la nouvelle page
+    const target = anchor ?? this.querySelector('h1') ?? document.querySelector('main');
+    if (target) {
+      if (target.tabIndex < 0) {
+        target.setAttribute('tabindex', '-1');
       }
+      target.focus({ preventScroll: true });
+    }
+
+    // Mesure relevée par le benchmark de performance (tests/performance.bench.js)
+    const name = `navigate ${path}`;
+    performance.clearMeasures(name);
+    performance.measure(name, { start });
+  }
+}
+
+class FragmentCache {
+  constructor({ maxEntries, storagePrefix, version }) {
+    this.maxEntries = maxEntries;
+    this.storagePrefix = storagePrefix;
+    this.storageName = storagePrefix && `${storagePrefix}-${version}`;
+    // Map conserve l'ordre d'insertion : la première clé est la moins récemment utilisée
+    this.entries = new Map();
+    this.pending = new Map();
+    this.storage = null;
+    this.stats = {
+      hits: 0,
+      storageHits: 0,
+      misses: 0,
+      deduplicated: 0,
+      prefetches: 0,
+    };
+  }
 
-      // FORMULAIRE ACCESSIBLE : Implémentation complète DSFR avec tous les attributs ARIA
-      const btnGood = document.getElementById('btnSubmitGood');
-      if (btnGood) {
-        btnGood.addEventListener('click', () => {
-          const form = document.getElementById('form-good');
-          const inputs = form.querySelectorAll('input');
-
-          let hasSomeInputInvalid = false;
-
-          for (const input of inputs) {
-            // Validation basique : champ non vide
-            let hasValid = input.value.trim() !== '';
-            let errorMessage = '';
-
-            // Validation spécifique pour l'email
-            if (input.type === 'email' && hasValid) {
-              const emailRegex = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
-              hasValid = emailRegex.test(input.value);
-              if (!hasValid) {
-                errorMessage = 'Le format de l\'email est invalide (ex: nom@domaine.fr)';
-              }
-            }
-
-            // Récupérer le groupe d'input DSFR et le message d'erreur
-            const inputGroup = input.closest('.fr-input-group');
-            const errorText = inputGroup.querySelector('.fr-error-text');
-            const label = inputGroup.querySelector('.fr-label');
-
-            if (hasValid) {
-              // Champ valide : retirer les classes d'erreur DSFR
-              input.classList.remove('fr-input--error');
-              inputGroup.classList.remove('fr-input-group--error');
-              input.ariaInvalid = false;
-              errorText.innerText = '';
-            } else {
-              // Champ invalide : ajouter les classes d'erreur DSFR
-              hasSomeInputInvalid = true;
-              input.classList.add('fr-input--error');
-              inputGroup.classList.add('fr-input-group--error');
-              input.ariaInvalid = true;
-
-              // Générer le message d'erreur
-              if (errorMessage) {
-                errorText.innerText = errorMessage;
-              } else {
-                // Extraire le texte du label (sans le hint-text et l'astérisque)
-                const labelText = label.childNodes[0].textContent.trim();
-                errorText.innerText = `Le champ ${labelText} est obligatoire`;
-              }
-            }
-          }
-
-          if (hasSomeInputInvalid) {
-            displayAlert('error', 'Certains champs sont incomplets ou invalides !');
-
-            // Donner le focus au premier champ invalide
-            const element = document.querySelector('[aria-invalid=true]');
-            if (element) {
-              element.focus();
-            }
-          } else {
-            displayAlert('success', 'Formulaire valide ! Tous les champs sont remplis correctement.');
-          }
-        });
+  get(url) {
+    if (this.entries.has(url)) {
+      this.stats.hits++;
+      const content = this.entries.get(url);
+      this.set(url, content);
+      return Promise.resolve(content);
+    }
+
+    if (this.pending.has(url)) {
+      this.stats.deduplicated++;
+      return this.pending.get(url);
+    }
+
+    return this.load(url);
+  }
+
+  prefetch(url) {
+    if (this.entries.has(url) || this.pending.has(url)) {
+      return this.pending.get(url) ?? Promise.resolve(this.entries.get(url));
+    }
+
+    this.stats.prefetches++;
+    return this.load(url);
+  }
+
+  set(url, content) {
+    this.entries.delete(url);
+    this.entries.set(url, content);
+
+    while (this.entries.size > this.maxEntries) {
+      this.entries.delete(this.entries.keys().next().value);
+    }
+  }
+
+  // Vide la mémoire et le stockage persistant (mesures à froid du benchmark)
+  async clear() {
+    this.entries.clear();
+
+    if (this.storageName && 'caches' in window) {
+      await caches.delete(this.storageName);
+      this.storage = null;
+    }
+  }
+
+  load(url) {
+    const promise = this.read(url)
+      .then((content) => {
+        this.set(url, content);
+        return content;
+      })
+      .finally(() => this.pending.delete(url));
+
+    this.pending.set(url, promise);
+    return promise;
+  }
+
+  async read(url) {
+    const storage = await this.openStorage();
+    if (storage) {
+      const stored = await storage.match(url);
+      if (stored) {
+        this.stats.storageHits++;
+        return await stored.text();
       }
     }
+
+    this.stats.misses++;
+    const responseHTML = await fetch(url);
+    if (!responseHTML.ok) {
+      throw new Error(
+        'Erreur lors du chargement du fichier HTML : ' + responseHTML.statusText
+      );
+    }
+
+    const content = await responseHTML.text();
+    if (storage) {
+      storage
+        .put(url, new Response(content, { headers: { 'Content-Type': 'text/html' } }))
+        .catch(() => {});
+    }
+
+    return content;
+  }
+
+  openStorage() {
+    if (!this.storage) {
+      this.storage = this.initStorage().catch(() => null);
+    }
+
+    return this.storage;
+  }
+
+  async initStorage() {
+    if (!this.storageName || !('caches' in window)) {
+      return null;
+    }
+
+    // Supprimer les fragments des déploiements précédents
+    const names = await caches.keys();
+    await Promise.all(
+      names
+        .filter(
+          (name) =>
+            name.startsWith(`${this.storagePrefix}-`) &&
+            name !== this.storageName
+        )
+        .map((name) => caches.delete(name))
+    );
+
+    return await caches.open(this.storageName);
   }
 }
 
+// La persistance est désactivée en développement pour toujours servir les fragments modifiés
+const fragmentCache = new FragmentCache({
+  maxEntries: 20,
+  storagePrefix: import.meta.env.PROD ? 'tester-a11y-fragments' : null,
+  version: __BUILD_ID__,
+});
+
+// Exposé pour suivre les hits/miss depuis la console ou les tests
+window.fragmentCache = fragmentCache;
+
 async function getHtmlContent(htmlFileName) {
-  const responseHTML = await fetch(`${absolutePath}/${htmlFileName}`);
-  if (!responseHTML.ok) {
-    throw new Error(
-      'Erreur lors du chargement du fichier HTML : ' + responseHTML.statusText
-    );
+  return await fragmentCache.get(`${absolutePath}/${htmlFileName}`);
+}
+
+function prefetchRoute(href) {
+  const path = getInAppRoute(href);
+  if (!path || navigator.connection?.saveData) {
+    return;
   }
 
-  return await responseHTML.text();
+  fragmentCache
+    .prefetch(`${absolutePath}/${routes[path].filename}`)
+    .catch(() => {});
 }
 
-function loadStylesheet(url) {
-  const link = document.createElement('link');
-  link.rel = 'stylesheet';
-  link.type = 'text/css';
-  link.href = `${absolutePath}/${url}`;
+function prefetchVisibleLinks() {
+  const requestIdle =
+    window.requestIdleCallback ?? ((callback) => setTimeout(callback, 200));
 
-  document.head.appendChild(link);
+  requestIdle(() => {
+    document
+      .querySelectorAll(`a[href^="${absolutePath}/"]`)
+      .forEach((link) => prefetchRoute(link.getAttribute('href')));
+  });
+}
+
+function onLinkIntent(event) {
+  const link = event.target.closest?.('a[href]');
+  if (link) {
+    prefetchRoute(link.getAttribute('href'));
+  }
+}
+
+document.addEventListener('pointerover', onLinkIntent, { passive: true });
+document.addEventListener('focusin', onLinkIntent);
+
+// Indique si l'élément a été rempli au build (et ne doit donc pas être rechargé).
+// Le marqueur n'est valable qu'une fois : les navigations suivantes rechargent le contenu.
+function consumePrerendered(element, expected) {
+  const prerendered = element.getAttribute('data-prerendered');
+  if (prerendered === null) {
+    return false;
+  }
+
+  element.removeAttribute('data-prerendered');
+  return expected === undefined || prerendered === expected;
 }
 
 function setAriaCurrentPage() {
@@ -331,6 +522,9 @@ function setAriaCurrentPage() {
 
   routerLinks.forEach((routerLink) => {
     let link = routerLink.querySelector('a');
+    if (!link) {
+      return;
+    }
 
     const path = window.location.pathname.replace(absolutePath, '');
 
@@ -341,10 +535,6 @@ function setAriaCurrentPage() {
       link.removeAttribute('aria-current');
       link.classList.remove('active');
     }
-
-    link.addEventListener('click', () => {
-      setAriaCurrentPage();
-    });
   });
 }
 
@@ -360,103 +550,29 @@ class RouterLink extends HTMLElement {
 
     link.href = href;
     link.text = this.attributes.title.value;
-    link.onclick = (event) => {
-      event.preventDefault();
-      document.querySelector('router-outlet').navigate(href);
-    };
 
     this.appendChild(link);
   }
 }
 
-function displayPicture(selector) {
-  const element = document.querySelector(selector);
-  if (element) {
-    if (element.classList.contains('hidden')) {
-      element.classList.remove('hidden');
-    } else {
-      element.classList.add('hidden');
-    }
-  }
-}
-
 class CustomAlert extends HTMLElement {
   async connectedCallback() {
-    loadStylesheet('components/alert/alert.scss');
-    this.innerHTML = await getHtmlContent('components/alert/alert.html');
-  }
-}
-
-function displayAlert(type, message) {
-  let iconClassName = '';
-  let className = '';
-
-  switch (type) {
-    case 'info':
-      iconClassName = 'fa-circle-info';
-      className = 'info';
-      break;
-    case 'success':
-      iconClassName = 'fa-circle-check';
-      className = 'success';
-      break;
-    case 'error':
-      iconClassName = 'fa-circle-exclamation';
-      className = 'error';
-      break;
-    default:
-      return;
-  }
-
-  const alertElement = document.querySelector('.alert');
-  if (!alertElement) {
-    throw new Error("Le composant alert n'est pas défini");
-  }
-
-  alertElement.classList.add('display');
-  alertElement.classList.add(className);
-
-  const iconElement = alertElement.querySelector('i');
-  if (iconElement) {
-    iconElement.classList.add(iconClassName);
-  }
-
-  const alertMessageElement = alertElement.querySelector('.alert-title');
-  if (alertMessageElement) {
-    alertMessageElement.innerText = message;
-  }
-
-  const buttonElement = alertElement.querySelector('button');
-  if (buttonElement) {
-    buttonElement.addEventListener('click', () =>
-      hideAlert(className, iconClassName)
-    );
+    if (!consumePrerendered(this)) {
+      this.innerHTML = await getHtmlContent('components/alert/alert.html');
+    }
   }
-
-  setTimeout(() => hideAlert(className, iconClassName), 1500);
 }
 
-function hideAlert(className, iconClassName) {
-  const alertElement = document.querySelector('.alert');
-  if (!alertElement) {
-    throw new Error("Le composant alert n'est pas défini");
-  }
-
-  alertElement.classList.remove('display');
-  alertElement.classList.remove(className);
-
-  const iconElement = alertElement.querySelector('i');
-  if (iconElement) {
-    iconElement.classList.remove(iconClassName);
-  }
-
-  const alertMessageElement = alertElement.querySelector('.alert-title');
-  if (alertMessageElement) {
-    alertMessageElement.innerText = '';
-  }
-
-  const buttonElement = alertElement.querySelector('button');
-  if (buttonElement) {
-    buttonElement.removeEventListener('click', buttonElement);
-  }
+// Démarrage en fin de module : les classes et les caches déclarés plus haut
+// doivent être initialisés avant la mise à niveau synchrone des éléments.
+// Les pages générées au build contiennent déjà le HTML : il suffit de l'hydrater
+if (document.querySelector('#app[data-prerendered]')) {
+  loadComponents();
+} else {
+  window.onload = () => {
+    getHtmlContent('components/main/main.html').then((innerHTML) => {
+      document.querySelector('#app').innerHTML = innerHTML;
+      loadComponents();
+    });
+  };
 }
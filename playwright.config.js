@@ -1,6 +1,13 @@
 // @ts-check
 import { defineConfig, devices } from '@playwright/test';
 
+// Les pages pré-rendues ne sont servies que par le build de production (vite preview) :
+// le projet « production » y vérifie l'hydratation (tests/*.prod.js).
+// Le benchmark de performance mesure aussi ce build :
+// BENCHMARK=1 npx playwright test --project=benchmark
+const benchmark = !!process.env.BENCHMARK;
+const previewURL = 'http://localhost:4174/tester-a11y/';
+
 /**
  * Read environment variables from file.
  * https://github.com/motdotla/dotenv
@@ -41,6 +48,30 @@ export default defineConfig({
       use: { ...devices['Desktop Safari'] },
     },
 
+    /* Pages pré-rendues du build de production */
+    {
+      name: 'production',
+      testMatch: /.*\.prod\.js/,
+      use: { ...devices['Desktop Chrome'], baseURL: previewURL },
+    },
+
+    /* Benchmark de performance (Chromium uniquement : throttling via CDP) */
+    ...(benchmark
+      ? [
+          {
+            name: 'benchmark',
+            testMatch: /.*\.bench\.js/,
+            fullyParallel: false,
+            use: {
+              ...devices['Desktop Chrome'],
+              baseURL: previewURL,
+              // Le précache du service worker fausserait les mesures du premier chargement
+              serviceWorkers: 'block',
+            },
+          },
+        ]
+      : []),
+
     /* Test against mobile viewports. */
     // {
     //   name: 'Mobile Chrome',
@@ -63,11 +94,19 @@ export default defineConfig({
   ],
 
   /* Run your local dev server before starting the tests */
-  webServer: {
-    command: 'npm run dev',
-    url: 'http://localhost:5174/tester-a11y/',
-    reuseExistingServer: !process.env.CI,
-  },
+  webServer: [
+    {
+      command: 'npm run dev',
+      url: 'http://localhost:5174/tester-a11y/',
+      reuseExistingServer: !process.env.CI,
+    },
+    {
+      command: 'npm run build && npm run preview -- --port 4174 --strictPort',
+      url: previewURL,
+      reuseExistingServer: !process.env.CI,
+      timeout: 5 * 60 * 1000,
+    },
+  ],
   use: {
     baseURL: 'http://localhost:5174/tester-a11y/',
   },
@@ -0,0 +1,57 @@
+// Table des routes, partagée entre le routeur client (index.js)
+// et le pré-rendu des pages au build (build/prerender.js).
+// `module` charge à la demande le comportement propre à la page :
+// `mount(outlet, { signal })` à l'affichage, `unmount()` (facultatif) au départ.
+
+export const absolutePath = '/tester-a11y';
+export const titlePage = `Démo accessibilité numérique`;
+
+export const routes = {
+  '/': { filename: 'pages/accueil.html', title: 'Accueil' },
+  '/les-contrastes': {
+    filename: 'pages/les-contrastes.html',
+    title: 'Testons les contrastes',
+  },
+  '/la-langue': {
+    filename: 'pages/cas-pratique-2.html',
+    title: 'Testons la langue',
+    lang: 'en',
+  },
+  '/les-images': {
+    filename: 'pages/les-images.html',
+    title: 'Les images',
+    module: () => import('./src/routes/les-images.js'),
+  },
+  '/les-formulaires': {
+    filename: 'pages/les-formulaires.html',
+    title: 'Les formulaires',
+    module: () => import('./src/routes/les-formulaires.js'),
+  },
+  '/cas-pratique-5': {
+    filename: 'pages/cas-pratique-5.html',
+    title: 'Cas pratique n°5 : les liens',
+  },
+  '/cas-pratique-6': {
+    filename: 'pages/cas-pratique-6.html',
+    title: 'Cas pratique n°6 : les boutons',
+  },
+  '/ci-cd': { filename: 'pages/ci-cd.html', title: 'Tests automatisés' },
+  '/bonus': { filename: 'pages/bonus.html', title: 'Bonus' },
+  '/faq': { filename: 'pages/faq.html', title: 'Foire aux questions' },
+  '/ressources': { filename: 'pages/ressources.html', title: 'Ressources' },
+  '/a-propos': { filename: 'pages/a-propos.html', title: 'A propos' },
+};
+
+export const notFoundRoute = {
+  filename: 'pages/erreur.html',
+  title: 'Erreur 404',
+};
+
+export function getRoute(path) {
+  return routes[path] ?? notFoundRoute;
+}
+
+// Fichier HTML généré pour une route (servi tel quel par GitHub Pages)
+export function getRouteOutput(path) {
+  return path === '/' ? 'index.html' : `${path.slice(1)}.html`;
+}
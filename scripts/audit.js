@@ -0,0 +1,194 @@
+// Audit d'accessibilité local de toutes les routes, sur le build courant (dist/).
+//
+//   npm run build && npm run audit
+//   npm run audit -- --concurrency 8 --force --exit
+//
+// Un seul navigateur est lancé et les routes sont auditées en parallèle (axe-core
+// injecté dans chaque page). Les résultats sont mis en cache selon l'empreinte
+// de la page pré-rendue : seules les routes modifiées sont ré-auditées.
+
+import { createHash } from 'node:crypto';
+import { existsSync } from 'node:fs';
+import { mkdir, readFile, writeFile } from 'node:fs/promises';
+import { createRequire } from 'node:module';
+import os from 'node:os';
+import path from 'node:path';
+import { parseArgs } from 'node:util';
+import { chromium } from '@playwright/test';
+import { preview } from 'vite';
+import { routes, notFoundRoute, getRouteOutput } from '../routes.js';
+
+const DIST_DIR = 'dist';
+const CACHE_FILE = 'node_modules/.cache/tester-a11y/audit.json';
+const REPORT_DIR = 'audit-report';
+
+// Défauts volontaires, présentés comme exemples à ne pas suivre
+const DEMO_ZONES = ['.bad-contrast-demo', '.cas-pratique-1 h1', '.cas-pratique-1 h2'];
+
+const { values: options } = parseArgs({
+  options: {
+    concurrency: { type: 'string', default: String(Math.min(os.cpus().length, 6)) },
+    force: { type: 'boolean', default: false },
+    exit: { type: 'boolean', default: false },
+  },
+});
+
+const axeSource = await readFile(
+  createRequire(import.meta.url).resolve('axe-core/axe.min.js'),
+  'utf-8'
+);
+
+if (!existsSync(DIST_DIR)) {
+  console.error(`Le dossier ${DIST_DIR}/ est absent : lancez d'abord "npm run build".`);
+  process.exit(1);
+}
+
+const pages = await Promise.all(
+  [
+    ...Object.entries(routes).map(([route, page]) => ({ route, ...page })),
+    { route: '/404', ...notFoundRoute, output: '404.html' },
+  ].map(async (page) => {
+    const output = page.output ?? getRouteOutput(page.route);
+    // Le document pré-rendu contient le fragment, les composants et les noms
+    // hachés des assets : son empreinte change dès que l'un d'eux change
+    const html = await readFile(path.join(DIST_DIR, output));
+    return { ...page, hash: hash(html + axeSource + DEMO_ZONES) };
+  })
+);
+
+const cache = options.force ? {} : await readCache();
+const pending = pages.filter(({ route, hash }) => cache[route]?.hash !== hash);
+
+const startedAt = Date.now();
+if (pending.length) {
+  await auditPages(pending, cache);
+  await writeJson(CACHE_FILE, cache);
+}
+
+const results = pages.map(({ route, title }) => ({
+  route,
+  title,
+  cached: !pending.some((page) => page.route === route),
+  ...cache[route],
+}));
+
+await writeJson(path.join(REPORT_DIR, 'report.json'), results);
+await writeFile(path.join(REPORT_DIR, 'junit.xml'), toJUnit(results));
+
+const violations = results.reduce((total, { violations }) => total + violations.length, 0);
+console.log(
+  `${pages.length} routes, ${pending.length} auditées, ${
+    pages.length - pending.length
+  } en cache, ${violations} violation(s) en ${Date.now() - startedAt} ms`
+);
+results
+  .filter(({ violations }) => violations.length)
+  .forEach(({ route, violations }) => {
+    console.log(`  ${route}`);
+    violations.forEach(({ id, impact, nodes }) =>
+      console.log(`    - [${impact}] ${id} (${nodes} élément(s))`)
+    );
+  });
+
+if (options.exit && violations) {
+  process.exitCode = 1;
+}
+
+async function auditPages(pages, cache) {
+  const server = await preview({ logLevel: 'silent', preview: { port: 4175 } });
+  const baseURL = server.resolvedUrls.local[0];
+  const browser = await chromium.launch();
+
+  try {
+    const queue = [...pages];
+    const worker = async () => {
+      for (let page = queue.shift(); page; page = queue.shift()) {
+        cache[page.route] = {
+          hash: page.hash,
+          violations: await auditPage(browser, new URL(page.route.slice(1), baseURL)),
+        };
+      }
+    };
+
+    const concurrency = Math.max(1, Number(options.concurrency));
+    await Promise.all(Array.from({ length: concurrency }, worker));
+  } finally {
+    await browser.close();
+    await server.close();
+  }
+}
+
+async function auditPage(browser, url) {
+  // Un contexte par route : pas de cache ni de service worker partagés
+  const context = await browser.newContext({ serviceWorkers: 'block' });
+
+  try {
+    const page = await context.newPage();
+    await page.goto(url.href, { waitUntil: 'networkidle' });
+    await page.addScriptTag({ content: axeSource });
+
+    const { violations } = await page.evaluate(
+      (exclude) => window.axe.run({ exclude }),
+      DEMO_ZONES
+    );
+
+    return violations.map(({ id, impact, help, helpUrl, nodes }) => ({
+      id,
+      impact,
+      help,
+      helpUrl,
+      nodes: nodes.length,
+      targets: nodes.map(({ target }) => target.join(' ')),
+    }));
+  } finally {
+    await context.close();
+  }
+}
+
+async function readCache() {
+  try {
+    return JSON.parse(await readFile(CACHE_FILE, 'utf-8'));
+  } catch {
+    return {};
+  }
+}
+
+async function writeJson(file, data) {
+  await mkdir(path.dirname(file), { recursive: true });
+  await writeFile(file, JSON.stringify(data, null, 2));
+}
+
+function toJUnit(results) {
+  const failures = results.filter(({ violations }) => violations.length).length;
+  const testcases = results.map(({ route, title, violations }) => {
+    const failure = violations.length
+      ? `\n    <failure message="${violations.length} violation(s)">${escapeXml(
+          violations
+            .map(({ id, impact, help, targets }) => `[${impact}] ${id} : ${help}\n  ${targets.join('\n  ')}`)
+            .join('\n')
+        )}</failure>\n  `
+      : '';
+
+    return `  <testcase classname="accessibilite" name="${escapeXml(`${route} - ${title}`)}">${failure}</testcase>`;
+  });
+
+  return [
+    '<?xml version="1.0" encoding="UTF-8"?>',
+    `<testsuite name="axe-core" tests="${results.length}" failures="${failures}">`,
+    ...testcases,
+    '</testsuite>',
+    '',
+  ].join('\n');
+}
+
+function escapeXml(value) {
+  return value
+    .replaceAll('&', '&amp;')
+    .replaceAll('<', '&lt;')
+    .replaceAll('>', '&gt;')
+    .replaceAll('"', '&quot;');
+}
+
+function hash(content) {
+  return createHash('sha256').update(content).digest('hex');
+}
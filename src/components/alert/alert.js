@@ -0,0 +1,82 @@
+// Affichage des messages du composant <custom-alert>.
+// Le bouton de fermeture est géré par délégation depuis index.js : aucun
+// écouteur n'est ajouté à chaque affichage.
+
+const ALERT_TYPES = {
+  info: { className: 'info', iconClassName: 'fa-circle-info' },
+  success: { className: 'success', iconClassName: 'fa-circle-check' },
+  error: { className: 'error', iconClassName: 'fa-circle-exclamation' },
+};
+
+const DISPLAY_DURATION = 1500;
+
+// Message actuellement affiché (une seule alerte à la fois)
+let currentAlert = null;
+
+function getAlertElement() {
+  const alertElement = document.querySelector('.alert');
+  if (!alertElement) {
+    throw new Error("Le composant alert n'est pas défini");
+  }
+
+  return alertElement;
+}
+
+export function displayAlert(type, message) {
+  const alertType = ALERT_TYPES[type];
+  if (!alertType) {
+    return;
+  }
+
+  const alertElement = getAlertElement();
+  hideAlert();
+
+  const { className, iconClassName } = alertType;
+
+  alertElement.classList.add('display');
+  alertElement.classList.add(className);
+
+  const iconElement = alertElement.querySelector('i');
+  if (iconElement) {
+    iconElement.classList.add(iconClassName);
+  }
+
+  const alertMessageElement = alertElement.querySelector('.alert-title');
+  if (alertMessageElement) {
+    alertMessageElement.innerText = message;
+  }
+
+  currentAlert = {
+    className,
+    iconClassName,
+    timeout: setTimeout(hideAlert, DISPLAY_DURATION),
+  };
+}
+
+export function hideAlert() {
+  if (!currentAlert) {
+    return;
+  }
+
+  const { className, iconClassName, timeout } = currentAlert;
+  currentAlert = null;
+  clearTimeout(timeout);
+
+  const alertElement = document.querySelector('.alert');
+  if (!alertElement) {
+    return;
+  }
+
+  alertElement.classList.remove('display');
+  alertElement.classList.remove(className);
+
+  const iconElement = alertElement.querySelector('i');
+  if (iconElement) {
+    iconElement.classList.remove(iconClassName);
+  }
+
+  const alertMessageElement = alertElement.querySelector('.alert-title');
+  if (alertMessageElement) {
+    alertMessageElement.innerText = '';
+  }
+}
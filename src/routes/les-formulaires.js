@@ -0,0 +1,107 @@
+import { displayAlert, hideAlert } from '../components/alert/alert.js';
+
+// Comportement de la page /les-formulaires
+
+export function mount(outlet, { signal }) {
+  // FORMULAIRE INACCESSIBLE : Uniquement bordure rouge, aucun message, aucun ARIA
+  const btnBad = outlet.querySelector('#btnSubmitBad');
+  if (btnBad) {
+    btnBad.addEventListener(
+      'click',
+      () => {
+        const form = outlet.querySelector('#form-bad');
+        const inputs = form.querySelectorAll('input');
+
+        for (const input of inputs) {
+          const hasValid = input.value.trim() !== '';
+
+          if (!hasValid) {
+            // Uniquement changement de bordure en rouge
+            input.style.borderColor = 'red';
+            input.style.borderWidth = '2px';
+          } else {
+            // Retirer la bordure rouge
+            input.style.borderColor = '';
+            input.style.borderWidth = '';
+          }
+        }
+        // Pas d'alerte, pas de message d'erreur, pas d'ARIA
+      },
+      { signal }
+    );
+  }
+
+  // FORMULAIRE ACCESSIBLE : Implémentation complète DSFR avec tous les attributs ARIA
+  const btnGood = outlet.querySelector('#btnSubmitGood');
+  if (btnGood) {
+    btnGood.addEventListener(
+      'click',
+      () => {
+        const form = outlet.querySelector('#form-good');
+        const inputs = form.querySelectorAll('input');
+
+        let hasSomeInputInvalid = false;
+
+        for (const input of inputs) {
+          // Validation basique : champ non vide
+          let hasValid = input.value.trim() !== '';
+          let errorMessage = '';
+
+          // Validation spécifique pour l'email
+          if (input.type === 'email' && hasValid) {
+            const emailRegex = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+            hasValid = emailRegex.test(input.value);
+            if (!hasValid) {
+              errorMessage = 'Le format de l\'email est invalide (ex: nom@domaine.fr)';
+            }
+          }
+
+          // Récupérer le groupe d'input DSFR et le message d'erreur
+          const inputGroup = input.closest('.fr-input-group');
+          const errorText = inputGroup.querySelector('.fr-error-text');
+          const label = inputGroup.querySelector('.fr-label');
+
+          if (hasValid) {
+            // Champ valide : retirer les classes d'erreur DSFR
+            input.classList.remove('fr-input--error');
+            inputGroup.classList.remove('fr-input-group--error');
+            input.ariaInvalid = false;
+            errorText.innerText = '';
+          } else {
+            // Champ invalide : ajouter les classes d'erreur DSFR
+            hasSomeInputInvalid = true;
+            input.classList.add('fr-input--error');
+            inputGroup.classList.add('fr-input-group--error');
+            input.ariaInvalid = true;
+
+            // Générer le message d'erreur
+            if (errorMessage) {
+              errorText.innerText = errorMessage;
+            } else {
+              // Extraire le texte du label (sans le hint-text et l'astérisque)
+              const labelText = label.childNodes[0].textContent.trim();
+              errorText.innerText = `Le champ ${labelText} est obligatoire`;
+            }
+          }
+        }
+
+        if (hasSomeInputInvalid) {
+          displayAlert('error', 'Certains champs sont incomplets ou invalides !');
+
+          // Donner le focus au premier champ invalide
+          const element = outlet.querySelector('[aria-invalid=true]');
+          if (element) {
+            element.focus();
+          }
+        } else {
+          displayAlert('success', 'Formulaire valide ! Tous les champs sont remplis correctement.');
+        }
+      },
+      { signal }
+    );
+  }
+}
+
+export function unmount() {
+  hideAlert();
+}
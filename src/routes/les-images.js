@@ -0,0 +1,36 @@
+// Comportement de la page /les-images
+
+export function mount(outlet, { signal }) {
+  const button = outlet.querySelector('#show-button');
+  if (!button) {
+    return;
+  }
+
+  button.addEventListener(
+    'click',
+    (event) => {
+      displayPicture(outlet.querySelector('.images'));
+
+      const element = event.target;
+
+      const hasHidden = outlet.querySelector('.hidden') !== null;
+
+      if (hasHidden) {
+        element.innerText = 'Afficher les images';
+      } else {
+        element.innerText = 'Cacher les images';
+      }
+    },
+    { signal }
+  );
+}
+
+function displayPicture(element) {
+  if (element) {
+    if (element.classList.contains('hidden')) {
+      element.classList.remove('hidden');
+    } else {
+      element.classList.add('hidden');
+    }
+  }
+}
@@ -0,0 +1,151 @@
+// Service worker pour l'usage hors ligne (ateliers sur un Wi-Fi instable).
+// La liste des fichiers à précharger est injectée au build par build/service-worker.js.
+
+const PRECACHE_MANIFEST = self.__PRECACHE_MANIFEST__;
+const CACHE_PREFIX = 'tester-a11y-sw';
+const PRECACHE_VERSION = self.__PRECACHE_VERSION__;
+// Tous les caches sont liés au déploiement : le suivant repart de zéro
+const PRECACHE = `${CACHE_PREFIX}-precache-${PRECACHE_VERSION}`;
+const RUNTIME = `${CACHE_PREFIX}-runtime-${PRECACHE_VERSION}`;
+const CDN = `${CACHE_PREFIX}-cdn-${PRECACHE_VERSION}`;
+const CURRENT_CACHES = [PRECACHE, RUNTIME, CDN];
+const CDN_ORIGIN = 'https://cdn.jsdelivr.net';
+const REVISION_HEADER = 'X-Precache-Revision';
+
+self.addEventListener('install', (event) => {
+  event.waitUntil(precache().then(() => self.skipWaiting()));
+});
+
+self.addEventListener('activate', (event) => {
+  event.waitUntil(cleanupCaches().then(() => self.clients.claim()));
+});
+
+self.addEventListener('fetch', (event) => {
+  const { request } = event;
+  if (request.method !== 'GET') {
+    return;
+  }
+
+  const url = new URL(request.url);
+
+  if (url.origin === CDN_ORIGIN) {
+    event.respondWith(staleWhileRevalidate(event));
+  } else if (url.origin === self.location.origin) {
+    if (request.mode === 'navigate') {
+      event.respondWith(handleNavigation(url));
+    } else {
+      event.respondWith(cacheFirst(request));
+    }
+  }
+});
+
+async function precache() {
+  const cache = await caches.open(PRECACHE);
+
+  await Promise.all(
+    PRECACHE_MANIFEST.map(async ({ url, revision }) => {
+      // Un fichier dont la révision n'a pas changé est repris du cache précédent
+      const previous = await caches.match(url);
+      if (previous && previous.headers.get(REVISION_HEADER) === revision) {
+        await cache.put(url, previous);
+        return;
+      }
+
+      const response = await fetch(url, { cache: 'reload' });
+      if (!response.ok) {
+        throw new Error(`Impossible de précharger ${url} : ${response.status}`);
+      }
+
+      const headers = new Headers(response.headers);
+      headers.set(REVISION_HEADER, revision);
+
+      await cache.put(
+        url,
+        new Response(await response.blob(), {
+          status: response.status,
+          statusText: response.statusText,
+          headers,
+        })
+      );
+    })
+  );
+}
+
+// Supprime les caches des déploiements précédents (précache, images et
+// fichiers non hachés mis en cache à l'usage, ressources du CDN)
+async function cleanupCaches() {
+  const names = await caches.keys();
+
+  await Promise.all(
+    names
+      .filter(
+        (name) =>
+          name.startsWith(`${CACHE_PREFIX}-`) && !CURRENT_CACHES.includes(name)
+      )
+      .map((name) => caches.delete(name))
+  );
+}
+
+async function matchPrecache(url) {
+  const cache = await caches.open(PRECACHE);
+  return await cache.match(url, { ignoreSearch: true });
+}
+
+// Les routes sont pré-rendues en /les-images.html, /index.html...
+async function handleNavigation(url) {
+  const pathname = url.pathname.endsWith('/')
+    ? `${url.pathname}index.html`
+    : `${url.pathname}.html`;
+
+  const cached = await matchPrecache(pathname);
+  if (cached) {
+    return cached;
+  }
+
+  try {
+    return await fetch(url);
+  } catch (error) {
+    const notFound = await matchPrecache(new URL('404.html', self.registration.scope));
+    if (notFound) {
+      return notFound;
+    }
+
+    throw error;
+  }
+}
+
+async function cacheFirst(request) {
+  const cache = await caches.open(RUNTIME);
+  const cached = (await matchPrecache(request.url)) ?? (await cache.match(request));
+  if (cached) {
+    return cached;
+  }
+
+  const response = await fetch(request);
+  if (response.ok) {
+    await cache.put(request, response.clone());
+  }
+
+  return response;
+}
+
+async function staleWhileRevalidate(event) {
+  const cache = await caches.open(CDN);
+  const cached = await cache.match(event.request);
+
+  const network = fetch(event.request).then(async (response) => {
+    // Les feuilles DSFR sont chargées sans CORS : la réponse est opaque
+    if (response.ok || response.type === 'opaque') {
+      await cache.put(event.request, response.clone());
+    }
+
+    return response;
+  });
+
+  if (cached) {
+    event.waitUntil(network.catch(() => {}));
+    return cached;
+  }
+
+  return await network;
+}
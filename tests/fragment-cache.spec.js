@@ -0,0 +1,80 @@
+// @ts-check
+import { test, expect } from '@playwright/test';
+
+test.describe('fragment-cache', () => {
+  test('Une page déjà visitée est servie depuis le cache mémoire', async ({
+    page,
+  }) => {
+    const requests = [];
+    page.on('request', (request) => requests.push(request.url()));
+
+    await page.goto('./les-formulaires');
+    await expect(page.locator('h1')).toContainText('Testons les formulaires');
+
+    await page.evaluate(async () => {
+      const outlet = document.querySelector('router-outlet');
+      await outlet.navigate('/tester-a11y/les-images');
+      await outlet.navigate('/tester-a11y/les-formulaires');
+    });
+    await expect(page.locator('h1')).toContainText('Testons les formulaires');
+
+    const stats = await page.evaluate(() => window.fragmentCache.stats);
+    expect(stats.hits).toBeGreaterThan(0);
+
+    const fetches = requests.filter((url) =>
+      url.endsWith('pages/les-formulaires.html')
+    );
+    expect(fetches).toHaveLength(1);
+  });
+
+  test('Un clic sur un lien du menu change de page sans recharger le document', async ({
+    page,
+  }) => {
+    await page.goto('./les-formulaires');
+    await expect(page.locator('h1')).toContainText('Testons les formulaires');
+
+    // Marqueur perdu en cas de chargement complet du document
+    await page.evaluate(() => (window.sameDocument = true));
+
+    const documents = [];
+    page.on('request', (request) => {
+      if (request.resourceType() === 'document') {
+        documents.push(request.url());
+      }
+    });
+
+    await page.locator('#navigation a[href="/tester-a11y/les-images"]').click();
+
+    await expect(page).toHaveURL(/\/tester-a11y\/les-images$/);
+    await expect(page.locator('h1')).toContainText('Testons les images');
+    await expect(page).toHaveTitle(/^Les images - /);
+    // Le focus suit le changement de page, comme après un chargement complet
+    await expect(page.locator('router-outlet h1')).toBeFocused();
+
+    expect(await page.evaluate(() => window.sameDocument)).toBe(true);
+    expect(documents).toHaveLength(0);
+
+    // Le fragment préchargé (temps libre ou survol du lien) sert au changement de page
+    const stats = await page.evaluate(() => window.fragmentCache.stats);
+    expect(stats.hits + stats.deduplicated).toBeGreaterThan(0);
+  });
+
+  test('Les requêtes simultanées vers un même fragment sont mutualisées', async ({
+    page,
+  }) => {
+    await page.goto('./');
+
+    const requests = [];
+    page.on('request', (request) => requests.push(request.url()));
+
+    const [first, second] = await page.evaluate(() =>
+      Promise.all([
+        window.fragmentCache.get('/tester-a11y/pages/erreur.html'),
+        window.fragmentCache.get('/tester-a11y/pages/erreur.html'),
+      ])
+    );
+
+    expect(first).toBe(second);
+    expect(requests.filter((url) => url.endsWith('pages/erreur.html'))).toHaveLength(1);
+  });
+});
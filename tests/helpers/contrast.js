@@ -0,0 +1,193 @@
+// @ts-check
+
+// Moteur de contraste : parcourt en une seule passe tous les nœuds texte
+// visibles d'une page et calcule leur ratio de contraste (WCAG 2.x).
+//
+// - l'arrière-plan effectif est obtenu en composant les fonds (éventuellement
+//   translucides) des ancêtres ;
+// - les calculs sont mémorisés par combinaison (couleur, fond, taille, graisse) ;
+// - un seul aller-retour avec le navigateur par thème.
+//
+// Les images de fond, dégradés et l'opacité des éléments ne sont pas pris en compte.
+
+// Seuils WCAG : AA 4,5:1 (3:1 grand texte), AAA 7:1 (4,5:1 grand texte)
+export const THRESHOLDS = {
+  aa: { normal: 4.5, large: 3 },
+  aaa: { normal: 7, large: 4.5 },
+};
+
+/**
+ * Analyse la page courante pour chacun des thèmes, dans la même session.
+ *
+ * @param {import('@playwright/test').Page} page
+ * @param {{ themes?: string[], exclude?: string }} [options]
+ *   `exclude` : sélecteur des zones à ignorer (ex. exemples volontairement non conformes)
+ */
+export async function scanContrast(page, { themes = ['light', 'dark'], exclude } = {}) {
+  const reports = {};
+
+  for (const theme of themes) {
+    reports[theme] = await page.evaluate(scanPage, {
+      theme,
+      exclude: exclude ?? null,
+      thresholds: THRESHOLDS,
+    });
+  }
+
+  return reports;
+}
+
+// Exécutée dans le navigateur : doit rester autonome
+function scanPage({ theme, exclude, thresholds }) {
+  document.documentElement.setAttribute('data-selected-theme', theme);
+
+  const styles = new Map();
+  const backgrounds = new Map();
+  const ratios = new Map();
+
+  const getStyle = (element) => {
+    if (!styles.has(element)) {
+      styles.set(element, getComputedStyle(element));
+    }
+    return styles.get(element);
+  };
+
+  const parseColor = (value) => {
+    const match = value.match(/^rgba?\(([^)]+)\)$/);
+    if (!match) {
+      return null;
+    }
+    const [r, g, b, a = 1] = match[1]
+      .split(/[\s,/]+/)
+      .filter(Boolean)
+      .map(Number);
+    return [r, g, b, a];
+  };
+
+  // Couleur `top` posée sur un fond opaque `bottom`
+  const composite = (top, bottom) => {
+    const alpha = top[3];
+    return [
+      top[0] * alpha + bottom[0] * (1 - alpha),
+      top[1] * alpha + bottom[1] * (1 - alpha),
+      top[2] * alpha + bottom[2] * (1 - alpha),
+      1,
+    ];
+  };
+
+  // Fond effectif (opaque) d'un élément ; le canevas est blanc par défaut
+  const getBackground = (element) => {
+    if (!element) {
+      return [255, 255, 255, 1];
+    }
+    if (backgrounds.has(element)) {
+      return backgrounds.get(element);
+    }
+
+    const own = parseColor(getStyle(element).backgroundColor) ?? [0, 0, 0, 0];
+    const background =
+      own[3] === 1 ? own : composite(own, getBackground(element.parentElement));
+
+    backgrounds.set(element, background);
+    return background;
+  };
+
+  const luminance = ([r, g, b]) => {
+    const [R, G, B] = [r, g, b].map((value) => {
+      value /= 255;
+      return value <= 0.03928 ? value / 12.92 : Math.pow((value + 0.055) / 1.055, 2.4);
+    });
+    return 0.2126 * R + 0.7152 * G + 0.0722 * B;
+  };
+
+  const ratio = (color, background) => {
+    const L1 = luminance(color);
+    const L2 = luminance(background);
+    return (Math.max(L1, L2) + 0.05) / (Math.min(L1, L2) + 0.05);
+  };
+
+  const describe = (element) =>
+    element.tagName.toLowerCase() +
+    (element.id ? `#${element.id}` : '') +
+    [...element.classList].map((className) => `.${className}`).join('');
+
+  const isVisible = (element) => {
+    if (element.checkVisibility && !element.checkVisibility({ checkOpacity: true, checkVisibilityCSS: true })) {
+      return false;
+    }
+    // Le texte réservé aux lecteurs d'écran (.sr-only) n'est pas concerné
+    const { width, height } = element.getBoundingClientRect();
+    return width > 1 && height > 1;
+  };
+
+  const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+  const violations = [];
+  let textNodes = 0;
+
+  for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+    const element = node.parentElement;
+    if (
+      !element ||
+      !node.textContent.trim() ||
+      ['SCRIPT', 'STYLE', 'NOSCRIPT', 'TEMPLATE'].includes(element.tagName) ||
+      (exclude && element.closest(exclude)) ||
+      !isVisible(element)
+    ) {
+      continue;
+    }
+
+    const style = getStyle(element);
+    const color = parseColor(style.color);
+    if (!color) {
+      continue;
+    }
+
+    textNodes++;
+
+    const background = getBackground(element);
+    const fontSize = parseFloat(style.fontSize);
+    const fontWeight = parseInt(style.fontWeight, 10);
+    const key = `${style.color}|${background.join(',')}|${fontSize}|${fontWeight}`;
+
+    if (!ratios.has(key)) {
+      // Grand texte : 18pt (24px), ou 14pt (18,66px) en gras
+      const large = fontSize >= 24 || (fontSize >= 18.66 && fontWeight >= 700);
+      const value = ratio(composite(color, background), background);
+      ratios.set(key, {
+        ratio: Math.round(value * 100) / 100,
+        large,
+        aa: value >= thresholds.aa[large ? 'large' : 'normal'],
+        aaa: value >= thresholds.aaa[large ? 'large' : 'normal'],
+      });
+    }
+
+    const result = ratios.get(key);
+    if (!result.aaa) {
+      violations.push({
+        element: describe(element),
+        text: node.textContent.trim().slice(0, 80),
+        color: style.color,
+        background: `rgb(${background.slice(0, 3).map(Math.round).join(', ')})`,
+        fontSize,
+        fontWeight,
+        ...result,
+      });
+    }
+  }
+
+  const root = document.documentElement;
+  const rootColor = parseColor(getStyle(root).color);
+  const rootBackground = getBackground(root);
+
+  return {
+    theme,
+    textNodes,
+    uniqueStyles: ratios.size,
+    root: {
+      color: getStyle(root).color,
+      background: getStyle(root).backgroundColor,
+      ratio: rootColor ? ratio(composite(rootColor, rootBackground), rootBackground) : 0,
+    },
+    violations,
+  };
+}
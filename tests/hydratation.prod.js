@@ -0,0 +1,62 @@
+// @ts-check
+import { test, expect } from '@playwright/test';
+
+// Exécuté sur le build de production (projet « production ») : les pages
+// servies sont pré-rendues et doivent être hydratées sans erreur.
+test.describe('hydratation', () => {
+  test('Les composants sont enregistrés sur une page pré-rendue', async ({ page }) => {
+    const errors = [];
+    page.on('pageerror', (error) => errors.push(error.message));
+
+    await page.goto('./les-formulaires');
+    await expect(page.locator('#app[data-prerendered]')).toBeAttached();
+    await expect(page.locator('h1')).toContainText('Testons les formulaires');
+
+    const defined = await page.evaluate(() =>
+      [
+        'router-outlet',
+        'router-link',
+        'custom-header',
+        'custom-footer',
+        'custom-picture',
+        'custom-alert',
+      ].filter((name) => !customElements.get(name))
+    );
+    expect(defined, 'éléments non enregistrés').toEqual([]);
+
+    // Le thème est appliqué par <custom-header> une fois hydraté
+    await expect(page.locator('html')).toHaveAttribute('data-selected-theme', /light|dark/);
+
+    // Le module de la page est monté : la validation affiche l'alerte
+    await page.locator('#btnSubmitGood').click();
+    await expect(page.locator('.alert')).toHaveClass(/error/);
+
+    expect(errors).toEqual([]);
+  });
+
+  test('Un lien du menu change de page sans recharger le document', async ({ page }) => {
+    await page.goto('./les-formulaires');
+    await expect(page.locator('h1')).toContainText('Testons les formulaires');
+    await page.evaluate(() => (window.sameDocument = true));
+
+    await page.locator('#navigation a[href="/tester-a11y/les-images"]').click();
+
+    await expect(page).toHaveURL(/\/tester-a11y\/les-images$/);
+    await expect(page.locator('h1')).toContainText('Testons les images');
+    // Le focus suit le changement de page, comme après un chargement complet
+    await expect(page.locator('router-outlet h1')).toBeFocused();
+    expect(await page.evaluate(() => window.sameDocument)).toBe(true);
+  });
+
+  test('Les images de la page sont rendues par <custom-picture>', async ({ page }) => {
+    await page.goto('./a-propos');
+
+    const images = page.locator('custom-picture img');
+    await expect(images.first()).toBeAttached();
+    expect(await images.count()).toBe(await page.locator('custom-picture').count());
+
+    // Les variantes viennent de l'entrée du manifeste portée par l'élément
+    await expect(page.locator('custom-picture[data-image] picture source').first()).toBeAttached();
+    await expect(page.locator('#image-manifest')).toHaveCount(0);
+  });
+});
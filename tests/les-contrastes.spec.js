@@ -0,0 +1,56 @@
+// @ts-check
+import { test, expect } from '@playwright/test';
+import { routes } from '../routes.js';
+import { scanContrast } from './helpers/contrast.js';
+
+// Exemples volontairement non conformes de la page « les contrastes »
+const DEMO_ZONES = '.bad-contrast-demo, .cas-pratique-1 h1, .cas-pratique-1 h2';
+
+test.describe('les-contrastes', () => {
+  test('Les exemples non conformes sont détectés dans les deux thèmes', async ({
+    page,
+  }) => {
+    await page.goto('./les-contrastes');
+    await expect(page.locator('h1')).toContainText('Testons les contrastes');
+
+    const reports = await scanContrast(page);
+
+    for (const { theme, violations } of Object.values(reports)) {
+      const failures = violations.filter(({ aa }) => !aa);
+
+      expect(
+        failures.some(({ element }) => element === 'h1'),
+        `titre principal non détecté (thème ${theme})`
+      ).toBe(true);
+      expect(
+        failures.some(({ element }) => element.includes('fr-callout__text')),
+        `exemples .bad-contrast-demo non détectés (thème ${theme})`
+      ).toBe(true);
+    }
+  });
+
+  for (const route of Object.keys(routes)) {
+    test(`Analyse des contrastes de la route ${route}`, async ({ page }, testInfo) => {
+      await page.goto(`.${route}`);
+      await expect(page.locator('router-outlet > *').first()).toBeVisible();
+      await expect(page.locator('custom-footer footer')).toBeVisible();
+
+      const reports = await scanContrast(page, { exclude: DEMO_ZONES });
+
+      // Le rapport complet (y compris les écarts AAA) reste joint au résultat
+      await testInfo.attach('contrastes', {
+        body: JSON.stringify(reports, null, 2),
+        contentType: 'application/json',
+      });
+
+      for (const { theme, textNodes, violations } of Object.values(reports)) {
+        expect(textNodes, `aucun texte analysé (thème ${theme})`).toBeGreaterThan(0);
+
+        const failures = violations
+          .filter(({ aa }) => !aa)
+          .map(({ element, text, ratio }) => `${element} (${ratio}:1) « ${text} »`);
+        expect(failures, `textes sous le seuil AA (thème ${theme})`).toEqual([]);
+      }
+    });
+  }
+});
@@ -0,0 +1,158 @@
+// @ts-check
+import { test, expect } from '@playwright/test';
+import { readFileSync, writeFileSync } from 'node:fs';
+import { routes } from '../routes.js';
+
+// Mesures de performance de chaque route sur le build de production,
+// comparées à la référence versionnée (tests/performance.baseline.json).
+//
+//   npm run bench                        -> compare aux budgets et à la référence
+//   UPDATE_BASELINE=1 npm run bench      -> enregistre une nouvelle référence
+
+const BASELINE_FILE = new URL('./performance.baseline.json', import.meta.url);
+const baseline = JSON.parse(readFileSync(BASELINE_FILE, 'utf-8'));
+const updateBaseline = !!process.env.UPDATE_BASELINE;
+
+// Profil réseau « 4G lente » et CPU ralenti 4x (équivalent Lighthouse mobile)
+const NETWORK = {
+  offline: false,
+  latency: 150,
+  downloadThroughput: (1.6 * 1024 * 1024) / 8,
+  uploadThroughput: (750 * 1024) / 8,
+};
+const CPU_SLOWDOWN = 4;
+
+const FRAGMENT_PATTERN = '/(pages|components)/[^?]+\\.html$';
+
+const measured = {};
+
+test.describe('performance', () => {
+  test.describe.configure({ mode: 'serial' });
+
+  test.afterAll(() => {
+    if (updateBaseline) {
+      baseline.routes = { ...baseline.routes, ...measured };
+      writeFileSync(BASELINE_FILE, JSON.stringify(baseline, null, 2) + '\n');
+    }
+  });
+
+  for (const route of Object.keys(routes)) {
+    test(`Route ${route}`, async ({ page, context }, testInfo) => {
+      const session = await context.newCDPSession(page);
+      await session.send('Network.enable');
+      await session.send('Network.emulateNetworkConditions', NETWORK);
+      await session.send('Emulation.setCPUThrottlingRate', { rate: CPU_SLOWDOWN });
+
+      let transferredBytes = 0;
+      session.on('Network.loadingFinished', ({ encodedDataLength }) => {
+        transferredBytes += encodedDataLength;
+      });
+
+      await page.addInitScript(() => {
+        window.__vitals = { lcp: 0, cls: 0 };
+        new PerformanceObserver((list) => {
+          list.getEntries().forEach((entry) => (window.__vitals.lcp = entry.startTime));
+        }).observe({ type: 'largest-contentful-paint', buffered: true });
+        new PerformanceObserver((list) => {
+          list.getEntries().forEach((entry) => {
+            if (!entry.hadRecentInput) {
+              window.__vitals.cls += entry.value;
+            }
+          });
+        }).observe({ type: 'layout-shift', buffered: true });
+      });
+
+      await page.goto(`.${route}`, { waitUntil: 'networkidle' });
+
+      const load = await page.evaluate((fragmentPattern) => {
+        const [navigation] = performance.getEntriesByType('navigation');
+        const fcp = performance.getEntriesByName('first-contentful-paint')[0];
+        // Fragments du chemin critique : le préchargement en tâche de fond est ignoré
+        const fragments = performance
+          .getEntriesByType('resource')
+          .filter(({ name }) => new RegExp(fragmentPattern).test(name))
+          .filter(({ startTime }) => startTime < window.__vitals.lcp);
+
+        return {
+          ttfb: navigation.responseStart,
+          fcp: fcp?.startTime ?? 0,
+          lcp: window.__vitals.lcp,
+          cls: window.__vitals.cls,
+          fragmentRequests: fragments.length,
+          fragmentWaterfall: fragments.length
+            ? Math.max(...fragments.map(({ responseEnd }) => responseEnd)) -
+              Math.min(...fragments.map(({ startTime }) => startTime))
+            : 0,
+        };
+      }, FRAGMENT_PATTERN);
+
+      // Changement de route côté client : d'abord à froid (caches vidés,
+      // fragment ni préchargé ni en cache HTTP), puis depuis le cache mémoire
+      const other = route === '/' ? '/faq' : '/';
+      await session.send('Network.clearBrowserCache');
+      const navigation = await page.evaluate(switchRoute, {
+        route,
+        other,
+        clearCache: true,
+      });
+      const repeatNavigation = await page.evaluate(switchRoute, {
+        route,
+        other,
+        clearCache: false,
+      });
+
+      const metrics = { ...load, transferredBytes, navigation, repeatNavigation };
+      measured[route] = metrics;
+      await testInfo.attach('metrics', {
+        body: JSON.stringify(metrics, null, 2),
+        contentType: 'application/json',
+      });
+
+      if (updateBaseline) {
+        return;
+      }
+
+      const reference = baseline.routes[route];
+      expect
+        .soft(reference, `aucune référence pour ${route} : lancer UPDATE_BASELINE=1 npm run bench`)
+        .toBeDefined();
+
+      for (const [metric, { max, slack }] of Object.entries(baseline.budgets)) {
+        const value = metrics[metric];
+
+        expect.soft(value, `${metric} dépasse le budget de ${max}`).toBeLessThanOrEqual(max);
+
+        if (reference) {
+          expect
+            .soft(reference[metric], `${metric} absent de la référence de ${route}`)
+            .toBeDefined();
+
+          const limit = reference[metric] * (1 + baseline.tolerance) + slack;
+          expect
+            .soft(value, `${metric} régresse par rapport à la référence (${reference[metric]})`)
+            .toBeLessThanOrEqual(limit);
+        }
+      }
+    });
+  }
+});
+
+// Exécutée dans le navigateur : aller vers `other` puis revenir à `route`,
+// en renvoyant la durée de ce retour
+async function switchRoute({ route, other, clearCache }) {
+  const outlet = document.querySelector('router-outlet');
+
+  // Vidé avant l'aller : aucun temps libre ne sépare ensuite les deux
+  // navigations, le fragment de `route` n'est donc pas préchargé entre-temps
+  if (clearCache) {
+    await window.fragmentCache.clear();
+  }
+
+  await outlet.navigate(`/tester-a11y${other}`);
+  await outlet.navigate(`/tester-a11y${route}`);
+
+  const [measure] = performance
+    .getEntriesByName(`navigate /tester-a11y${route}`)
+    .slice(-1);
+  return measure.duration;
+}
@@ -0,0 +1,96 @@
+// @ts-check
+import { test, expect } from '@playwright/test';
+
+// Les compteurs d'écouteurs et de nœuds DOM sont lus via le protocole CDP
+const ROUNDS = 150;
+const WARMUP_ROUNDS = 10;
+
+async function navigateBackAndForth(page, rounds) {
+  await page.evaluate(async (rounds) => {
+    const outlet = document.querySelector('router-outlet');
+    for (let i = 0; i < rounds; i++) {
+      await outlet.navigate('/tester-a11y/les-images');
+      await outlet.navigate('/tester-a11y/les-formulaires');
+    }
+  }, rounds);
+}
+
+async function getMetrics(session) {
+  await session.send('HeapProfiler.collectGarbage');
+  const { metrics } = await session.send('Performance.getMetrics');
+  return Object.fromEntries(metrics.map(({ name, value }) => [name, value]));
+}
+
+test.describe('router', () => {
+  test('Les modules de page sont chargés à la demande et montés une seule fois', async ({
+    page,
+  }) => {
+    const modules = [];
+    page.on('request', (request) => {
+      if (/\/les-images[\w-]*\.js/.test(request.url())) {
+        modules.push(request.url());
+      }
+    });
+
+    await page.goto('./les-formulaires');
+    await expect(page.locator('h1')).toContainText('Testons les formulaires');
+    expect(modules, 'module de /les-images chargé sans y naviguer').toHaveLength(0);
+
+    await navigateBackAndForth(page, 3);
+    expect(modules).toHaveLength(1);
+
+    // Chaque exécution du gestionnaire de validation donne le focus au premier
+    // champ invalide : le nombre d'appels à focus() compte les gestionnaires actifs
+    await page.evaluate(() => {
+      window.focusCalls = 0;
+      const focus = HTMLElement.prototype.focus;
+      HTMLElement.prototype.focus = function (...args) {
+        window.focusCalls++;
+        return focus.apply(this, args);
+      };
+    });
+
+    await page.locator('#btnSubmitGood').click();
+    await expect(page.locator('.alert')).toHaveClass(/error/);
+    await expect(page.locator('#form-good [aria-invalid=true]').first()).toBeFocused();
+    expect(await page.evaluate(() => window.focusCalls)).toBe(1);
+
+    await page.locator('#btnSubmitGood').click();
+    expect(await page.evaluate(() => window.focusCalls)).toBe(2);
+
+    await page.locator('.alert-button').dispatchEvent('click');
+    await expect(page.locator('.alert')).not.toHaveClass(/display/);
+  });
+
+  test(`La mémoire reste stable après ${ROUNDS * 2} navigations`, async ({
+    page,
+    context,
+    browserName,
+  }) => {
+    test.skip(browserName !== 'chromium', 'Métriques disponibles via CDP uniquement');
+    test.setTimeout(120 * 1000);
+
+    await page.goto('./les-formulaires');
+    await expect(page.locator('h1')).toContainText('Testons les formulaires');
+
+    const session = await context.newCDPSession(page);
+    await session.send('Performance.enable');
+
+    // Préchauffage : fragments en cache, modules chargés, JIT stabilisé
+    await navigateBackAndForth(page, WARMUP_ROUNDS);
+    const before = await getMetrics(session);
+
+    await navigateBackAndForth(page, ROUNDS);
+    const after = await getMetrics(session);
+
+    expect(after.JSEventListeners, 'des écouteurs ne sont pas libérés').toBeLessThanOrEqual(
+      before.JSEventListeners
+    );
+    expect(after.Nodes, 'des nœuds DOM détachés sont conservés').toBeLessThanOrEqual(
+      before.Nodes * 1.1
+    );
+    expect(after.JSHeapUsedSize, 'le tas JavaScript grossit').toBeLessThan(
+      before.JSHeapUsedSize * 1.5
+    );
+  });
+});
@@ -1,48 +1,72 @@
 import { defineConfig } from 'vite';
 import { viteStaticCopy } from 'vite-plugin-static-copy';
 import FullReload from 'vite-plugin-full-reload';
+import criticalCss from './build/critical-css.js';
+import dsfr from './build/dsfr.js';
+import fonts from './build/fonts.js';
+import images from './build/images.js';
+import prerender from './build/prerender.js';
+import serviceWorker from './build/service-worker.js';
+
+// Identifiant de build, utilisé pour invalider les caches côté client
+const buildId = process.env.GITHUB_SHA ?? String(Date.now());
+
+// Dossiers copiés tels quels dans /dist (et préchargés par le service worker)
+const staticCopyTargets = [
+  {
+    src: 'src/pages', // Le dossier à copier
+    dest: '', // Copie à la racine de /dist
+  },
+  {
+    src: 'public/.nojekyll',
+    dest: '',
+  },
+  {
+    src: 'src/components',
+    dest: '',
+  },
+  {
+    src: 'src/assets/img',
+    dest: 'src/assets/',
+  },
+];
+
+// Fichiers analysés pour ne garder que les styles et glyphes utilisés
+const sources = [
+  'src/pages',
+  'src/components',
+  'src/routes',
+  'index.js',
+  'routes.js',
+];
 
 export default defineConfig({
   base: '/tester-a11y/', // Nom du repo GitHub
+  define: {
+    __BUILD_ID__: JSON.stringify(buildId),
+  },
   plugins: [
     FullReload(
       [
         'src/pages/**',
         'src/components/**',
+        'src/routes/**',
         'style.scss',
         'index.js',
         'index.html',
-        '404.html',
+        'routes.js',
       ],
       { delay: 100 }
     ),
-    viteStaticCopy({
-      targets: [
-        {
-          src: 'src/pages', // Le dossier à copier
-          dest: '', // Copie à la racine de /dist
-        },
-        {
-          src: '404.html',
-          dest: '',
-        },
-        {
-          src: 'public/.nojekyll',
-          dest: '',
-        },
-        {
-          src: 'src/components',
-          dest: '',
-        },
-        {
-          src: 'src/assets/img',
-          dest: 'src/assets/',
-        },
-        {
-          src: 'src/assets/fonts',
-          dest: 'src/assets/',
-        },
-      ],
-    }),
+    viteStaticCopy({ targets: staticCopyTargets }),
+    // Ordre important : les pages sont optimisées avant d'être pré-rendues,
+    // le CSS critique est extrait des pages pré-rendues, puis le service
+    // worker référence le résultat final
+    dsfr({ sources }),
+    fonts({ sources }),
+    images({ src: 'src/assets/img' }),
+    prerender(),
+    criticalCss(),
+    serviceWorker({ targets: staticCopyTargets }),
   ],
 });